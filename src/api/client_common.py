@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Monica API Client Common Module
+
+Response decoding and retry logic for the Monica API client, kept apart from
+the HTTP transport so they can be reused and tested on their own.
+"""
+
+import random
+import logging
+import threading
+from typing import List, Optional
+
+try:
+    import orjson
+except ImportError:
+    # Optional speedup; fall back to stdlib json when orjson isn't installed
+    orjson = None
+    import json
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+if msgspec is not None:
+    # Typed view of a chat completion: only the fields we read are decoded,
+    # everything else (usage, logprobs, ...) is skipped without allocation
+    class _ChatMessage(msgspec.Struct):
+        content: Optional[str] = None
+    
+    class _ChatChoice(msgspec.Struct):
+        message: Optional[_ChatMessage] = None
+    
+    class _ChatResponse(msgspec.Struct):
+        choices: List[_ChatChoice] = []
+    
+    _CHAT_RESPONSE_DECODER = msgspec.json.Decoder(_ChatResponse)
+
+
+def decode_completion(raw: bytes) -> Optional[str]:
+    """
+    Extract the first choice's message content from a chat completion body
+    
+    Args:
+        raw: Raw JSON response body
+    
+    Returns:
+        Optional[str]: Message content, None if the response carries none
+    """
+    if msgspec is not None:
+        response = _CHAT_RESPONSE_DECODER.decode(raw)
+        if not response.choices or response.choices[0].message is None:
+            return None
+        return response.choices[0].message.content
+    
+    result = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    choices = result.get('choices') or [{}]
+    return (choices[0].get('message') or {}).get('content')
+
+
+class RetryBudget:
+    """
+    Process-wide retry budget acting as a simple circuit breaker
+    
+    Tracks an exponentially weighted moving average (EWMA) of call failures.
+    While the failure rate is above the threshold, retries are refused so a
+    provider outage doesn't turn every prompt into a full retry storm; each
+    call still makes its first attempt, which acts as the recovery probe.
+    """
+    
+    def __init__(self, alpha: float = 0.2, failure_threshold: float = 0.5, min_samples: int = 5):
+        """
+        Initialize retry budget
+        
+        Args:
+            alpha: EWMA smoothing factor, weight of the most recent outcome
+            failure_threshold: Failure rate above which retries are refused
+            min_samples: Number of outcomes required before the budget can trip
+        """
+        self.alpha = alpha
+        self.failure_threshold = failure_threshold
+        self.min_samples = min_samples
+        self.failure_rate = 0.0
+        self.samples = 0
+        self._lock = threading.Lock()
+    
+    def record_success(self) -> None:
+        """Record a successful call"""
+        with self._lock:
+            self.failure_rate *= (1 - self.alpha)
+            self.samples += 1
+    
+    def record_failure(self) -> None:
+        """Record a failed (retriable) call attempt"""
+        with self._lock:
+            self.failure_rate = self.failure_rate * (1 - self.alpha) + self.alpha
+            self.samples += 1
+    
+    def should_allow_retry(self) -> bool:
+        """
+        Check whether another retry may be spent
+        
+        Returns:
+            bool: False while the recent failure rate exceeds the threshold
+        """
+        with self._lock:
+            if self.samples < self.min_samples:
+                return True
+            return self.failure_rate < self.failure_threshold
+
+
+# Status codes worth retrying with backoff; everything else fails fast
+RETRIABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Shared by all clients in the process unless one is injected explicitly
+DEFAULT_BUDGET = RetryBudget()
+
+
+class RetryPolicy:
+    """
+    Retry decisions for one client: which failures to retry, how long to
+    back off, and whether the shared retry budget still allows it
+    """
+    
+    def __init__(self, logger: logging.Logger, budget: Optional[RetryBudget] = None, max_delay: int = 300):
+        """
+        Initialize retry policy
+        
+        Args:
+            logger: Logger of the owning client
+            budget: Retry budget to consult before retrying, defaults to the process-wide one
+            max_delay: Maximum backoff delay in seconds
+        """
+        self.logger = logger
+        self.budget = budget or DEFAULT_BUDGET
+        self.max_delay = max_delay
+        # Independent random stream so concurrent workers don't retry in lockstep
+        self._rng = random.SystemRandom()
+    
+    @staticmethod
+    def is_retriable_status(status_code: int) -> bool:
+        """Check whether an HTTP status is a rate limit or transient server error"""
+        return status_code in RETRIABLE_STATUS_CODES
+    
+    def calculate_backoff_delay(self, attempt: int, base_delay: int, max_delay: Optional[int] = None) -> float:
+        """
+        Calculate exponential backoff delay time with full jitter
+        
+        Args:
+            attempt: Current attempt number (starting from 0)
+            base_delay: Base delay time in seconds
+            max_delay: Maximum delay time in seconds, defaults to the policy's
+        
+        Returns:
+            float: Delay time in seconds
+        """
+        # Exponential backoff: cap = base_delay * (2 ^ attempt), limited to max_delay
+        cap = min(base_delay * (2 ** attempt), self.max_delay if max_delay is None else max_delay)
+        # Full jitter: pick uniformly in [0, cap] to desynchronize clients
+        return self._rng.uniform(0, cap)
+    
+    def record_success(self) -> None:
+        """Record a successful call against the retry budget"""
+        self.budget.record_success()
+    
+    def next_delay(self, attempt: int, retry_attempts: int, base_delay: int) -> Optional[float]:
+        """
+        Record a failed attempt and decide whether to try again
+        
+        Args:
+            attempt: Number of the attempt that just failed (starting from 0)
+            retry_attempts: Total number of attempts allowed
+            base_delay: Base retry delay in seconds
+        
+        Returns:
+            Optional[float]: Seconds to wait before the next attempt, None to give up
+        """
+        self.budget.record_failure()
+        
+        if attempt >= retry_attempts - 1:
+            return None
+        
+        if not self.budget.should_allow_retry():
+            self.logger.warning("Retry budget exhausted due to sustained API failures, giving up without retrying")
+            return None
+        
+        backoff_delay = self.calculate_backoff_delay(attempt, base_delay)
+        self.logger.info(f"Will retry in {backoff_delay:.2f} seconds...")
+        return backoff_delay
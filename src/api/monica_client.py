@@ -8,15 +8,55 @@ Provides functionality for interacting with Monica API.
 """
 
 import time
+import socket
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
 import logging
-from typing import Dict, Any, Tuple, Optional
+from typing import Iterator, Tuple, Optional
+
+try:
+    import orjson
+except ImportError:
+    # Optional speedup; fall back to stdlib json when orjson isn't installed
+    orjson = None
+    import json
+
+from api.client_common import RetryBudget, RetryPolicy, decode_completion
+
+
+class StreamingError(Exception):
+    """Streaming completion failed in a way a buffered completion might not"""
+
+
+# Client errors a server may return for a malformed or unsupported request,
+# such as one carrying the stream flag; others (401/403/404, ...) would fail
+# a buffered request just the same
+STREAM_REJECTION_STATUS_CODES = frozenset({400, 415, 422})
+
+
+class TunedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled connections disable Nagle and enable TCP keep-alive"""
+    
+    # urllib3's defaults already set TCP_NODELAY; make sure it stays and add keep-alive
+    SOCKET_OPTIONS = [
+        opt for opt in HTTPConnection.default_socket_options
+        if opt[:2] != (socket.IPPROTO_TCP, socket.TCP_NODELAY)
+    ] + [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    ]
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault('socket_options', self.SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
 
 
 class MonicaClient:
     """Monica API client class providing API call functionality"""
     
-    def __init__(self, base_url: str, api_key: str, model: str):
+    def __init__(self, base_url: str, api_key: str, model: str, max_response_bytes: int = 2 * 1024 * 1024,
+                 budget: Optional[RetryBudget] = None, verify_ssl: bool = True):
         """
         Initialize Monica API client
         
@@ -24,19 +64,33 @@ class MonicaClient:
             base_url: API base URL
             api_key: API key
             model: Model name
+            max_response_bytes: Maximum accepted response body size in bytes
+            budget: Retry budget to consult before retrying, defaults to the process-wide one
+            verify_ssl: Verify TLS certificates; only disable for local development
         """
         self.base_url = base_url
         self.api_key = api_key
         self.model = model
+        self.max_response_bytes = max_response_bytes
         self.headers = {
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
         }
         self.logger = logging.getLogger(__name__)
+        self.retry_policy = RetryPolicy(self.logger, budget)
+        self.budget = self.retry_policy.budget
+        
+        # Pooled session so keep-alive connections are reused across retries and prompts
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.verify = verify_ssl
+        adapter = TunedHTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
     
-    def calculate_backoff_delay(self, attempt: int, base_delay: int, max_delay: int = 300) -> int:
+    def calculate_backoff_delay(self, attempt: int, base_delay: int, max_delay: int = 300) -> float:
         """
-        Calculate exponential backoff delay time
+        Calculate exponential backoff delay time with full jitter
         
         Args:
             attempt: Current attempt number (starting from 0)
@@ -44,12 +98,29 @@ class MonicaClient:
             max_delay: Maximum delay time in seconds
             
         Returns:
-            int: Delay time in seconds
+            float: Delay time in seconds
         """
-        # Exponential backoff: delay = base_delay * (2 ^ attempt)
-        delay = base_delay * (2 ** attempt)
-        # Limit maximum delay time
-        return min(delay, max_delay)
+        return self.retry_policy.calculate_backoff_delay(attempt, base_delay, max_delay)
+    
+    def _read_capped_body(self, response: requests.Response) -> Optional[bytes]:
+        """
+        Read a streamed response body, stopping once it exceeds max_response_bytes
+        
+        Args:
+            response: Response obtained with stream=True
+            
+        Returns:
+            Optional[bytes]: Raw body, or None if the size cap was exceeded
+        """
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(65536):
+            size += len(chunk)
+            if size > self.max_response_bytes:
+                response.close()
+                return None
+            chunks.append(chunk)
+        return b"".join(chunks)
     
     def complete(self, prompt: str, retry_attempts: int = 3, retry_delay: int = 5, 
                 temperature: float = 0.7, max_tokens: int = 4000) -> str:
@@ -74,6 +145,131 @@ class MonicaClient:
             raise Exception(f"Monica API call failed after {retry_attempts} attempts")
         return content
     
+    def complete_stream(self, prompt: str, retry_attempts: int = 3, retry_delay: int = 5,
+                        temperature: float = 0.7, max_tokens: int = 4000) -> Iterator[str]:
+        """
+        Call Monica API for text completion, yielding content as it is generated
+        
+        Requests a server-sent event stream; if the server answers with a plain
+        JSON completion instead, its content is yielded as a single chunk.
+        Failures before the first chunk are retried like call_api. A broken
+        event stream, or a request rejected as malformed (400/415/422) or with
+        an error mentioning streaming, raises StreamingError, since a buffered
+        call may still succeed where streaming did not.
+        
+        Args:
+            prompt: Input prompt
+            retry_attempts: Number of retry attempts
+            retry_delay: Base retry delay in seconds
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            
+        Yields:
+            str: Successive pieces of the response content
+            
+        Raises:
+            StreamingError: When the event stream breaks or the streaming request is rejected
+            Exception: When the request fails for any other reason, or after all retry attempts
+        """
+        data = {
+            "model": self.model,
+            "messages": [
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "stream": True
+        }
+        
+        url = f"{self.base_url}/chat/completions"
+        
+        start_time = time.time()
+        streamed = False
+        
+        attempts_made = 0
+        for attempt in range(retry_attempts):
+            attempts_made = attempt + 1
+            try:
+                self.logger.info(f"Calling Monica API with streaming (model: {self.model}, attempt: {attempt + 1}/{retry_attempts})")
+                response = self.session.post(url, json=data, timeout=60, stream=True)
+                
+                if response.status_code == 200:
+                    with response:
+                        if 'text/event-stream' in response.headers.get('Content-Type', ''):
+                            try:
+                                for chunk in self._iter_stream_content(response):
+                                    streamed = True
+                                    yield chunk
+                            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                                if not streamed:
+                                    raise
+                                # Retrying would repeat content the caller already consumed
+                                raise StreamingError(f"Event stream interrupted: {e}") from e
+                            except Exception as e:
+                                raise StreamingError(f"Malformed event stream: {e}") from e
+                        else:
+                            # Server ignored the stream flag, fall back to the buffered body
+                            raw = self._read_capped_body(response)
+                            if raw is None:
+                                raise Exception(f"API response exceeded {self.max_response_bytes} bytes")
+                            content = decode_completion(raw)
+                            if not content:
+                                raise Exception(f"API response missing content: {raw[:500]!r}")
+                            yield content
+                    
+                    self.retry_policy.record_success()
+                    self.logger.info(f"Streaming API call successful, elapsed time: {time.time() - start_time:.2f}s")
+                    return
+                
+                elif self.retry_policy.is_retriable_status(response.status_code):
+                    # Rate limit or transient server error, use exponential backoff
+                    self.logger.warning(f"Retriable API error (status code: {response.status_code}): {response.text}")
+                
+                else:
+                    # Client errors won't succeed on retry; only a rejection that may
+                    # be down to the streaming request is worth a buffered attempt
+                    message = f"API call failed (status code: {response.status_code}): {response.text}"
+                    if (response.status_code in STREAM_REJECTION_STATUS_CODES
+                            or 'stream' in response.text.lower()):
+                        raise StreamingError(message)
+                    raise Exception(message)
+                
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                self.logger.error(f"API connection error: {e}")
+            
+            backoff_delay = self.retry_policy.next_delay(attempt, retry_attempts, retry_delay)
+            if backoff_delay is None:
+                break
+            time.sleep(backoff_delay)
+        
+        raise Exception(f"Monica API streaming call failed after {attempts_made} attempts")
+    
+    def _iter_stream_content(self, response: requests.Response) -> Iterator[str]:
+        """
+        Parse a chat completion SSE stream into content deltas
+        
+        Args:
+            response: Streaming response with an event-stream body
+            
+        Yields:
+            str: Non-empty content deltas in arrival order
+        """
+        size = 0
+        for line in response.iter_lines():
+            size += len(line)
+            if size > self.max_response_bytes:
+                raise Exception(f"API response exceeded {self.max_response_bytes} bytes")
+            if not line.startswith(b"data:"):
+                continue
+            payload = line[5:].strip()
+            if payload == b"[DONE]":
+                return
+            event = orjson.loads(payload) if orjson is not None else json.loads(payload)
+            choices = event.get('choices') or [{}]
+            delta = (choices[0].get('delta') or {}).get('content')
+            if delta:
+                yield delta
+    
     def call_api(self, prompt: str, retry_attempts: int = 3, retry_delay: int = 5,
                 temperature: float = 0.7, max_tokens: int = 4000) -> Tuple[Optional[str], float]:
         """
@@ -103,50 +299,66 @@ class MonicaClient:
         
         start_time = time.time()
         
+        attempts_made = 0
         for attempt in range(retry_attempts):
+            attempts_made = attempt + 1
             try:
                 self.logger.info(f"Calling Monica API (model: {self.model}, attempt: {attempt + 1}/{retry_attempts})")
-                response = requests.post(url, headers=self.headers, json=data, verify=False, timeout=60)
+                response = self.session.post(url, json=data, timeout=60, stream=True)
                 
                 if response.status_code == 200:
-                    result = response.json()
-                    content = result.get('choices', [{}])[0].get('message', {}).get('content')
-                    if content:
-                        elapsed_time = time.time() - start_time
-                        self.logger.info(f"API call successful, elapsed time: {elapsed_time:.2f}s")
-                        return content, elapsed_time
+                    raw = self._read_capped_body(response)
+                    if raw is None:
+                        # Oversized body, treat as a transient failure and retry
+                        self.logger.error(f"API response exceeded {self.max_response_bytes} bytes, discarding")
                     else:
-                        self.logger.error(f"API response missing content: {result}")
-                        
-                elif response.status_code == 429:
-                    # Rate limit error, use exponential backoff
-                    self.logger.warning(f"Hit API rate limit (429), will retry with exponential backoff")
-                    
-                elif response.status_code >= 500:
-                    # Server error, use exponential backoff
-                    self.logger.error(f"Server error (status code: {response.status_code}): {response.text}")
-                    
-                else:
-                    # Other errors, may not need retry
-                    self.logger.error(f"API call failed (status code: {response.status_code}): {response.text}")
-                    if 400 <= response.status_code < 500:
-                        # Client error, usually no need to retry
+                        content = decode_completion(raw)
                         elapsed_time = time.time() - start_time
+                        if content:
+                            self.retry_policy.record_success()
+                            self.logger.info(f"API call successful, elapsed time: {elapsed_time:.2f}s")
+                            return content, elapsed_time
+                        # A well-formed reply without content won't change on retry
+                        self.logger.error(f"API response missing content: {raw[:500]!r}")
                         return None, elapsed_time
                 
+                elif self.retry_policy.is_retriable_status(response.status_code):
+                    # Rate limit or transient server error, use exponential backoff
+                    self.logger.warning(f"Retriable API error (status code: {response.status_code}): {response.text}")
+                
+                else:
+                    # Client errors and unexpected statuses won't succeed on retry
+                    self.logger.error(f"API call failed (status code: {response.status_code}): {response.text}")
+                    elapsed_time = time.time() - start_time
+                    return None, elapsed_time
+                
             except requests.exceptions.Timeout as e:
                 self.logger.error(f"API call timeout: {e}")
             except requests.exceptions.ConnectionError as e:
                 self.logger.error(f"API connection error: {e}")
             except Exception as e:
+                # Unexpected errors (e.g. malformed JSON) are not retried
                 self.logger.error(f"API call exception: {e}")
+                elapsed_time = time.time() - start_time
+                return None, elapsed_time
             
-            if attempt < retry_attempts - 1:
-                # Calculate exponential backoff delay
-                backoff_delay = self.calculate_backoff_delay(attempt, retry_delay)
-                self.logger.info(f"Will retry in {backoff_delay} seconds...")
-                time.sleep(backoff_delay)
+            backoff_delay = self.retry_policy.next_delay(attempt, retry_attempts, retry_delay)
+            if backoff_delay is None:
+                break
+            time.sleep(backoff_delay)
         
         elapsed_time = time.time() - start_time
-        self.logger.error(f"API call still failed after {retry_attempts} attempts, total elapsed time: {elapsed_time:.2f}s")
-        return None, elapsed_time
\ No newline at end of file
+        self.logger.error(f"API call still failed after {attempts_made} attempts, total elapsed time: {elapsed_time:.2f}s")
+        return None, elapsed_time
+    
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections"""
+        self.session.close()
+    
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - closes the HTTP session"""
+        self.close()
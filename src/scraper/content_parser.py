@@ -5,15 +5,159 @@ This module provides LLM-powered intelligent parsing of scraped competition cont
 to extract structured information for application workflow optimization.
 """
 
+import os
 import json
+import hashlib
 import logging
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 from datetime import datetime
 import re
 
+from workflow.output_io import dumps_json
 
-@dataclass
+try:
+    import orjson
+except ImportError:
+    # Optional speedup; fall back to stdlib json when orjson isn't installed
+    orjson = None
+
+try:
+    # RE2 compiles to an automaton: linear-time scans, no catastrophic backtracking
+    import re2 as _re_fast
+except ImportError:
+    _re_fast = re
+
+
+def _loads_json(text: str) -> Any:
+    """Decode JSON text, using orjson when available.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers only
+    need to handle the stdlib exception.
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+# Rule-based parsing tables, compiled once at import time.
+# Patterns are lowercase and run against the lowercased content, so no
+# case-insensitive matching is needed.
+# One alternation per field so a single scan finds the first (leftmost) hit
+_PRIZE_RE = _re_fast.compile(
+    r'(?P<gbp>£[\d,]+)'
+    r'|(?P<usd>\$[\d,]+)'
+    r'|(?P<eur>€[\d,]+)'
+    r'|(?P<pounds>[\d,]+\s*pounds?)'
+    # Stop at a currency sign so "Prize of £10,000" yields the currency match
+    r'|(?:prize|funding)[^\d£$€]{0,40}(?P<amount>[\d,]+(?:\s*pounds?)?)'
+)
+
+_DEADLINE_RE = _re_fast.compile(
+    r'(?:deadline|apply\s*by|close[sd]?)[^\d]{0,40}(?P<date>\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})'
+)
+
+_CLOSED_PHRASES = frozenset(['applications closed', 'deadline passed', 'no longer accepting'])
+_OPEN_PHRASES = frozenset(['applications open', 'now accepting', 'apply now'])
+_UPCOMING_PHRASES = frozenset(['coming soon', 'opening soon', 'applications will open'])
+
+# Tuple rather than frozenset: output order of benefits follows this order
+_BENEFIT_KEYWORDS = (
+    'mentorship', 'networking', 'funding', 'investment', 'support',
+    'guidance', 'resources', 'exposure', 'recognition', 'accelerator'
+)
+
+# Checked in insertion order; the first stage with a matching keyword wins
+_STAGE_KEYWORDS = {
+    'idea': ('idea stage', 'early idea', 'concept'),
+    'mvp': ('mvp', 'minimum viable product', 'prototype'),
+    'seed': ('seed stage', 'early stage', 'startup'),
+    'growth': ('scaling', 'growth stage', 'expansion')
+}
+
+# (section, field, weight) scoring table for validate_parsed_data
+_WEIGHT_TABLE = (
+    ("competition_basic_info", "name", 0.15),
+    ("competition_basic_info", "organizer", 0.10),
+    ("competition_basic_info", "application_status", 0.15),
+    ("competition_basic_info", "deadline", 0.20),
+    ("benefits_and_prizes", "prize_fund", 0.15),
+    ("benefits_and_prizes", "benefits", 0.10),
+    ("target_participants", "criteria", 0.10),
+    ("competition_focus", "stage_preference", 0.05)
+)
+
+# Single-pass scanner over every rule keyword. The lookahead makes matches
+# overlapping (like an Aho-Corasick walk), so each phrase is reported wherever
+# it occurs regardless of neighbouring matches. Stays on stdlib re because RE2
+# doesn't support lookahead. No phrase is a prefix of another,
+# so longest-first alternation never hides a match starting at the same offset.
+_RULE_PHRASES = sorted(
+    set().union(_CLOSED_PHRASES, _OPEN_PHRASES, _UPCOMING_PHRASES, _BENEFIT_KEYWORDS,
+                *_STAGE_KEYWORDS.values()),
+    key=len, reverse=True
+)
+_RULE_PHRASE_RE = re.compile('(?=(' + '|'.join(re.escape(p) for p in _RULE_PHRASES) + '))')
+
+
+# Static parts of the extraction prompt, split around the scraped content.
+# Keeping the prefix byte-identical across calls also lets providers reuse
+# prefix caches.
+_PROMPT_PREFIX = """## Task: Extract structured competition information from website content
+
+### Input Content:
+"""
+
+_PROMPT_SUFFIX = """
+
+### Extraction Requirements:
+Please analyze the above content and extract the following structured information in JSON format:
+
+{
+  "competition_basic_info": {
+    "name": "Competition name (or null if not found)",
+    "organizer": "Main organizing body (or null if not found)",
+    "partners": ["Partner 1", "Partner 2"] or null,
+    "application_status": "Current status: open/closed/upcoming (or null if unclear)",
+    "deadline": "Application deadline in any format found (or null if not mentioned)"
+  },
+  "target_participants": {
+    "description": "Overall description of target participants (or null)",
+    "criteria": ["Eligibility criterion 1", "Eligibility criterion 2"] or null
+  },
+  "competition_focus": {
+    "stage_preference": "Preferred project stage: idea/MVP/prototype/seed/etc (or null)",
+    "industry_focus": ["Industry 1", "Industry 2"] or null,
+    "innovation_type": "Type of innovation preferred (or null)"
+  },
+  "benefits_and_prizes": {
+    "prize_fund": "Total prize amount with currency (or null if not mentioned)",
+    "benefits": ["Benefit 1", "Benefit 2"] or null,
+    "support_offered": ["Support type 1", "Support type 2"] or null
+  },
+  "evaluation_criteria": {
+    "explicit_criteria": ["Stated evaluation criterion 1", "Criterion 2"] or null,
+    "implied_preferences": ["Inferred preference 1", "Preference 2"] or null
+  }
+}
+
+### Extraction Guidelines:
+1. Extract information exactly as presented in the source text
+2. Use null for any field where information is not clearly available
+3. For dates, preserve the original format found in the text
+4. For monetary amounts, include the currency symbol/code as written
+5. Focus on explicit information; only infer when patterns are very clear
+6. If multiple pieces of similar information exist, include the most comprehensive
+7. Maintain original terminology and phrasing where possible
+
+### Output Format:
+Respond with ONLY the JSON object, no additional text or explanation."""
+
+
+@dataclass(slots=True)
 class ParsedCompetitionInfo:
     """Structured representation of parsed competition information."""
     
@@ -46,6 +190,43 @@ class ParsedCompetitionInfo:
     confidence_score: Optional[float] = None
     parsing_timestamp: Optional[str] = None
     raw_content_length: Optional[int] = None
+    parsing_method: Optional[str] = None  # 'llm' or 'rules'; not saved
+
+
+# JSON section -> ((JSON key, ParsedCompetitionInfo attribute), ...), in output
+# order; used both to build the object from the extraction JSON and to save it
+_OUTPUT_LAYOUT = (
+    ("competition_basic_info", (
+        ("name", "name"),
+        ("organizer", "organizer"),
+        ("partners", "partners"),
+        ("application_status", "application_status"),
+        ("deadline", "deadline")
+    )),
+    ("target_participants", (
+        ("description", "target_description"),
+        ("criteria", "eligibility_criteria")
+    )),
+    ("competition_focus", (
+        ("stage_preference", "stage_preference"),
+        ("industry_focus", "industry_focus"),
+        ("innovation_type", "innovation_type")
+    )),
+    ("benefits_and_prizes", (
+        ("prize_fund", "prize_fund"),
+        ("benefits", "benefits"),
+        ("support_offered", "support_offered")
+    )),
+    ("evaluation_criteria", (
+        ("explicit_criteria", "explicit_criteria"),
+        ("implied_preferences", "implied_preferences")
+    )),
+    ("metadata", (
+        ("confidence_score", "confidence_score"),
+        ("parsing_timestamp", "parsing_timestamp"),
+        ("raw_content_length", "raw_content_length")
+    ))
+)
 
 
 class ContentParser:
@@ -62,59 +243,14 @@ class ContentParser:
         self.llm_client = llm_client
         self.config = config or {}
         self.logger = logging.getLogger(__name__)
+        
+        # On-disk cache of LLM extraction results, keyed by a hash of the prompt
+        self.cache_enabled = self.config.get('cache_enabled', True)
+        self.cache_dir = Path(self.config.get('cache_dir', '.cache/content_parser'))
     
     def generate_extraction_prompt(self, content: str) -> str:
         """Generate the prompt template for competition information extraction."""
-        
-        prompt = f"""## Task: Extract structured competition information from website content
-
-### Input Content:
-{content}
-
-### Extraction Requirements:
-Please analyze the above content and extract the following structured information in JSON format:
-
-{{
-  "competition_basic_info": {{
-    "name": "Competition name (or null if not found)",
-    "organizer": "Main organizing body (or null if not found)",
-    "partners": ["Partner 1", "Partner 2"] or null,
-    "application_status": "Current status: open/closed/upcoming (or null if unclear)",
-    "deadline": "Application deadline in any format found (or null if not mentioned)"
-  }},
-  "target_participants": {{
-    "description": "Overall description of target participants (or null)",
-    "criteria": ["Eligibility criterion 1", "Eligibility criterion 2"] or null
-  }},
-  "competition_focus": {{
-    "stage_preference": "Preferred project stage: idea/MVP/prototype/seed/etc (or null)",
-    "industry_focus": ["Industry 1", "Industry 2"] or null,
-    "innovation_type": "Type of innovation preferred (or null)"
-  }},
-  "benefits_and_prizes": {{
-    "prize_fund": "Total prize amount with currency (or null if not mentioned)",
-    "benefits": ["Benefit 1", "Benefit 2"] or null,
-    "support_offered": ["Support type 1", "Support type 2"] or null
-  }},
-  "evaluation_criteria": {{
-    "explicit_criteria": ["Stated evaluation criterion 1", "Criterion 2"] or null,
-    "implied_preferences": ["Inferred preference 1", "Preference 2"] or null
-  }}
-}}
-
-### Extraction Guidelines:
-1. Extract information exactly as presented in the source text
-2. Use null for any field where information is not clearly available
-3. For dates, preserve the original format found in the text
-4. For monetary amounts, include the currency symbol/code as written
-5. Focus on explicit information; only infer when patterns are very clear
-6. If multiple pieces of similar information exist, include the most comprehensive
-7. Maintain original terminology and phrasing where possible
-
-### Output Format:
-Respond with ONLY the JSON object, no additional text or explanation."""
-
-        return prompt
+        return _PROMPT_PREFIX + content + _PROMPT_SUFFIX
     
     def parse_with_llm(self, content: str) -> Optional[Dict[str, Any]]:
         """
@@ -137,7 +273,7 @@ Respond with ONLY the JSON object, no additional text or explanation."""
             response = self.llm_client.complete(prompt)
             
             # Parse JSON response
-            parsed_data = json.loads(response.strip())
+            parsed_data = _loads_json(response.strip())
             
             self.logger.info("Successfully parsed content with LLM")
             return parsed_data
@@ -169,66 +305,40 @@ Respond with ONLY the JSON object, no additional text or explanation."""
         content_lower = content.lower()
         
         # Extract prize information
-        prize_patterns = [
-            r'£([\d,]+)',
-            r'\$([\d,]+)',
-            r'€([\d,]+)',
-            r'([\d,]+)\s*pounds?',
-            r'prize.*?([\d,]+)',
-            r'funding.*?([\d,]+)'
-        ]
-        
-        for pattern in prize_patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
+        match = _PRIZE_RE.search(content_lower)
+        if match:
+            # Report the original casing; lower() can change length for a few
+            # non-ASCII characters, in which case offsets no longer line up
+            if len(content_lower) == len(content):
+                parsed["benefits_and_prizes"]["prize_fund"] = content[match.start():match.end()]
+            else:
                 parsed["benefits_and_prizes"]["prize_fund"] = match.group(0)
-                break
         
         # Extract deadline information
-        deadline_patterns = [
-            r'deadline.*?(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})',
-            r'apply.*?by.*?(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})',
-            r'close.*?(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})'
-        ]
-        
-        for pattern in deadline_patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
-                parsed["competition_basic_info"]["deadline"] = match.group(1)
-                break
+        match = _DEADLINE_RE.search(content_lower)
+        if match:
+            parsed["competition_basic_info"]["deadline"] = match.group('date')
+        
+        # Collect every rule keyword present in one scan over the content
+        found = {match.group(1) for match in _RULE_PHRASE_RE.finditer(content_lower)}
         
         # Detect application status
-        if any(phrase in content_lower for phrase in ['applications closed', 'deadline passed', 'no longer accepting']):
+        if not found.isdisjoint(_CLOSED_PHRASES):
             parsed["competition_basic_info"]["application_status"] = "closed"
-        elif any(phrase in content_lower for phrase in ['applications open', 'now accepting', 'apply now']):
+        elif not found.isdisjoint(_OPEN_PHRASES):
             parsed["competition_basic_info"]["application_status"] = "open"
-        elif any(phrase in content_lower for phrase in ['coming soon', 'opening soon', 'applications will open']):
+        elif not found.isdisjoint(_UPCOMING_PHRASES):
             parsed["competition_basic_info"]["application_status"] = "upcoming"
         
         # Extract benefits
-        benefits = []
-        benefit_keywords = [
-            'mentorship', 'networking', 'funding', 'investment', 'support',
-            'guidance', 'resources', 'exposure', 'recognition', 'accelerator'
-        ]
-        
-        for keyword in benefit_keywords:
-            if keyword in content_lower:
-                benefits.append(keyword.capitalize())
+        benefits = [keyword.capitalize() for keyword in _BENEFIT_KEYWORDS if keyword in found]
         
         if benefits:
             parsed["benefits_and_prizes"]["benefits"] = benefits[:5]  # Limit to top 5
         
         # Extract stage preferences
-        stage_keywords = {
-            'idea': ['idea stage', 'early idea', 'concept'],
-            'mvp': ['mvp', 'minimum viable product', 'prototype'],
-            'seed': ['seed stage', 'early stage', 'startup'],
-            'growth': ['scaling', 'growth stage', 'expansion']
-        }
-        
-        for stage, keywords in stage_keywords.items():
-            if any(kw in content_lower for kw in keywords):
+        for stage, keywords in _STAGE_KEYWORDS.items():
+            if not found.isdisjoint(keywords):
                 parsed["competition_focus"]["stage_preference"] = stage
                 break
         
@@ -244,56 +354,113 @@ Respond with ONLY the JSON object, no additional text or explanation."""
         score = 0.0
         total_weight = 0.0
         
-        # Scoring weights for different information types
-        weights = {
-            "competition_basic_info": {
-                "name": 0.15,
-                "organizer": 0.10,
-                "application_status": 0.15,
-                "deadline": 0.20
-            },
-            "benefits_and_prizes": {
-                "prize_fund": 0.15,
-                "benefits": 0.10
-            },
-            "target_participants": {
-                "criteria": 0.10
-            },
-            "competition_focus": {
-                "stage_preference": 0.05
-            }
-        }
-        
-        for section, fields in weights.items():
+        # Only sections present in the parsed data count towards the total
+        for section, field_name, weight in _WEIGHT_TABLE:
             if section in parsed_data:
-                for field, weight in fields.items():
-                    total_weight += weight
-                    if field in parsed_data[section] and parsed_data[section][field]:
-                        score += weight
+                total_weight += weight
+                if (parsed_data[section] or {}).get(field_name):
+                    score += weight
         
         return min(score / total_weight if total_weight > 0 else 0.0, 1.0)
     
-    def parse_content(self, content: str) -> ParsedCompetitionInfo:
+    def _cache_path(self, content: str) -> Path:
+        """Return the cache file for the extraction prompt built from content."""
+        # Hash the full prompt so edits to the prompt template invalidate entries
+        prompt = self.generate_extraction_prompt(content)
+        key = hashlib.blake2b(prompt.encode('utf-8'), digest_size=20).hexdigest()
+        return self.cache_dir / f"{key}.json"
+    
+    def _load_cached(self, content: str) -> Optional[Dict[str, Any]]:
+        """Return a cached LLM extraction result for content, if any."""
+        if not self.cache_enabled:
+            return None
+        
+        cache_file = self._cache_path(content)
+        try:
+            with open(cache_file, 'rb') as f:
+                parsed_data = _loads_json(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable cache entry {cache_file}: {e}")
+            return None
+        
+        self.logger.info(f"Using cached LLM parsing result from {cache_file}")
+        return parsed_data
+    
+    def _store_cached(self, content: str, parsed_data: Dict[str, Any]) -> None:
+        """Persist an LLM extraction result for content."""
+        if not self.cache_enabled:
+            return
+        
+        cache_file = self._cache_path(content)
+        # Write to a per-writer temp file and swap it in, so concurrent parses
+        # (parse_batch) or a crash mid-write never leave a truncated entry
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, 'wb') as f:
+                f.write(dumps_json(parsed_data))
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            self.logger.warning(f"Failed to write cache entry {cache_file}: {e}")
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
+    
+    def parse_content(self, content: str, force: bool = False) -> ParsedCompetitionInfo:
         """
         Main method to parse competition content using available methods.
         
         Args:
             content: Raw scraped content
+            force: If True, ignore any cached LLM result and call the LLM again
             
         Returns:
             ParsedCompetitionInfo object with extracted data
         """
         self.logger.info(f"Starting content parsing for {len(content)} characters")
         
-        # Try LLM parsing first
+        # Try LLM parsing first, reusing a cached result for identical input
         parsed_data = None
         if self.llm_client:
-            parsed_data = self.parse_with_llm(content)
+            parsed_data = None if force else self._load_cached(content)
+            if not parsed_data:
+                parsed_data = self.parse_with_llm(content)
+                if parsed_data:
+                    self._store_cached(content, parsed_data)
         
         # Fallback to rule-based parsing
+        parsing_method = 'llm'
         if not parsed_data:
             self.logger.info("LLM parsing unavailable, using rule-based fallback")
             parsed_data = self.parse_with_rules(content)
+            parsing_method = 'rules'
+        
+        result = self._finalize_parsed_info(parsed_data, content)
+        result.parsing_method = parsing_method
+        return result
+    
+    def parse_batch(self, contents: List[str], max_workers: int = 16) -> List[ParsedCompetitionInfo]:
+        """
+        Parse several independent documents concurrently using threads.
+        
+        parse_content is dominated by blocking network I/O in the LLM client,
+        which releases the GIL, so a thread pool scales it without asyncio.
+        
+        Args:
+            contents: Raw scraped contents to parse
+            max_workers: Maximum number of concurrent parsing threads
+            
+        Returns:
+            ParsedCompetitionInfo objects in the same order as ``contents``
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.parse_content, contents))
+    
+    def _finalize_parsed_info(self, parsed_data: Dict[str, Any], content: str) -> ParsedCompetitionInfo:
+        """Score parsed dictionary and convert it to a ParsedCompetitionInfo object."""
         
         # Calculate confidence score
         confidence = self.validate_parsed_data(parsed_data)
@@ -310,79 +477,36 @@ Respond with ONLY the JSON object, no additional text or explanation."""
     def _dict_to_parsed_info(self, data: Dict[str, Any]) -> ParsedCompetitionInfo:
         """Convert parsed dictionary to ParsedCompetitionInfo object."""
         
-        basic = data.get("competition_basic_info", {})
-        target = data.get("target_participants", {})
-        focus = data.get("competition_focus", {})
-        benefits = data.get("benefits_and_prizes", {})
-        criteria = data.get("evaluation_criteria", {})
-        
-        return ParsedCompetitionInfo(
-            name=basic.get("name"),
-            organizer=basic.get("organizer"),
-            partners=basic.get("partners"),
-            application_status=basic.get("application_status"),
-            deadline=basic.get("deadline"),
-            
-            target_description=target.get("description"),
-            eligibility_criteria=target.get("criteria"),
-            
-            stage_preference=focus.get("stage_preference"),
-            industry_focus=focus.get("industry_focus"),
-            innovation_type=focus.get("innovation_type"),
-            
-            prize_fund=benefits.get("prize_fund"),
-            benefits=benefits.get("benefits"),
-            support_offered=benefits.get("support_offered"),
-            
-            explicit_criteria=criteria.get("explicit_criteria"),
-            implied_preferences=criteria.get("implied_preferences")
-        )
+        values = {}
+        for section_key, section_fields in _OUTPUT_LAYOUT[:-1]:
+            # Null sections the LLM may produce count as empty; metadata is filled in later
+            section = data.get(section_key) or {}
+            for key, attr in section_fields:
+                values[attr] = section.get(key)
+        
+        return ParsedCompetitionInfo(**values)
     
     def save_parsed_info(self, parsed_info: ParsedCompetitionInfo, output_path: str) -> None:
         """Save parsed information to JSON file."""
         
-        # Convert to dictionary for JSON serialization
+        # Convert to the sectioned dictionary layout for JSON serialization
         data = {
-            "competition_basic_info": {
-                "name": parsed_info.name,
-                "organizer": parsed_info.organizer,
-                "partners": parsed_info.partners,
-                "application_status": parsed_info.application_status,
-                "deadline": parsed_info.deadline
-            },
-            "target_participants": {
-                "description": parsed_info.target_description,
-                "criteria": parsed_info.eligibility_criteria
-            },
-            "competition_focus": {
-                "stage_preference": parsed_info.stage_preference,
-                "industry_focus": parsed_info.industry_focus,
-                "innovation_type": parsed_info.innovation_type
-            },
-            "benefits_and_prizes": {
-                "prize_fund": parsed_info.prize_fund,
-                "benefits": parsed_info.benefits,
-                "support_offered": parsed_info.support_offered
-            },
-            "evaluation_criteria": {
-                "explicit_criteria": parsed_info.explicit_criteria,
-                "implied_preferences": parsed_info.implied_preferences
-            },
-            "metadata": {
-                "confidence_score": parsed_info.confidence_score,
-                "parsing_timestamp": parsed_info.parsing_timestamp,
-                "raw_content_length": parsed_info.raw_content_length
-            }
+            section_key: {key: getattr(parsed_info, attr) for key, attr in section_fields}
+            for section_key, section_fields in _OUTPUT_LAYOUT
         }
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            # orjson emits UTF-8 without escaping non-ASCII, like ensure_ascii=False
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
         
         self.logger.info(f"Parsed information saved to {output_path}")
     
     def save_to_competition_dir(self, parsed_info: ParsedCompetitionInfo, competition_name: str, base_dir: str = 'input') -> None:
         """Save parsed info to standardized competition directory structure."""
-        from pathlib import Path
         
         output_dir = Path(base_dir) / competition_name / 'competition_info'
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -393,9 +517,10 @@ Respond with ONLY the JSON object, no additional text or explanation."""
 class MonicaAIClient:
     """Monica AI client for LLM-powered content parsing."""
     
-    def __init__(self, api_key: str, base_url: str = "https://openapi.monica.im/v1", model: str = "gpt-4.1"):
+    def __init__(self, api_key: str, base_url: str = "https://openapi.monica.im/v1", model: str = "gpt-4.1",
+                 verify_ssl: bool = True):
         from api.monica_client import MonicaClient
-        self.client = MonicaClient(base_url, api_key, model)
+        self.client = MonicaClient(base_url, api_key, model, verify_ssl=verify_ssl)
         self.logger = logging.getLogger(__name__)
     
     def complete(self, prompt: str, temperature: float = 0.7, max_tokens: int = 4000) -> str:
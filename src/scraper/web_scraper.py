@@ -11,29 +11,198 @@ Version: 1.0
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
+import asyncio
+import hashlib
 import random
 import logging
+import re
+import sys
 from typing import Dict, List, Optional, Tuple
-from urllib.parse import urljoin, urlparse
-from dataclasses import dataclass
+from urllib.parse import ParseResult, urljoin, urlparse
+from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
 import json
 from datetime import datetime
 
 try:
-    from bs4 import BeautifulSoup
-    from selenium import webdriver
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    from selenium.webdriver.chrome.options import Options
-    from selenium.common.exceptions import TimeoutException, WebDriverException
-except ImportError as e:
-    print(f"Required dependencies not installed: {e}")
-    print("Please install: pip install beautifulsoup4 selenium requests")
-
-
-@dataclass
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    # Reported when a page is actually parsed, see _parse_html()
+    LexborHTMLParser = None
+
+try:
+    import orjson
+except ImportError:
+    # Optional speedup; fall back to stdlib json when orjson isn't installed
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:
+    # Optional; content fingerprints fall back to hashlib's blake2b
+    xxhash = None
+
+try:
+    import requests_cache
+except ImportError:
+    # Optional on-disk HTTP cache; scraping works uncached without it
+    requests_cache = None
+
+try:
+    import brotli  # noqa: F401 - presence enables transparent br decoding in urllib3/aiohttp
+    _ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    # Only advertise encodings the HTTP clients can actually decode
+    _ACCEPT_ENCODING = 'gzip, deflate'
+
+# Selenium is only needed for dynamic scraping and is imported on first use,
+# keeping static-only workloads free of its import time and memory cost
+
+
+# Elements that never carry page content and are removed before text extraction
+_DECOMPOSE_TAGS = ("script", "style", "nav", "footer", "header")
+
+# Candidate main-content containers, probed in order of preference
+_MAIN_SELECTORS = (
+    'main', 'article', '.content', '#content', '.main-content',
+    '.entry-content', '.post-content', '[role="main"]'
+)
+
+# Bytes fetched by the pre-scrape probe, and the visible text below which a
+# page carrying a client-side app marker is treated as a JavaScript shell
+_PROBE_BYTES = 65536
+_SPA_TEXT_THRESHOLD = 200
+_SPA_MARKER_RE = re.compile(
+    rb'<div[^>]+id=["\'](?:root|app|__next)["\']|__NEXT_DATA__|<noscript',
+    re.IGNORECASE
+)
+
+# Caps on the number of links and images kept per page
+_MAX_LINKS = 50
+_MAX_IMAGES = 20
+
+# Loading indicators to wait out during dynamic scraping
+_LOADING_SELECTORS = ('.loading', '.spinner', '[data-loading="true"]', '.loader')
+
+# Indicators that a page carries real competition information
+_COMPETITION_KEYWORDS = frozenset({
+    'competition', 'apply', 'application', 'deadline', 'prize', 'eligibility',
+    'requirements', 'submit', 'participants', 'winner', 'startup', 'innovation',
+    'entrepreneur', 'funding', 'investment', 'accelerator'
+})
+
+# Keyword scanning lowercases and searches content in windows so it can stop
+# after the first few kilobytes on relevant pages; windows overlap by the
+# longest keyword so matches spanning a boundary are still found
+_KEYWORD_WINDOW = 8192
+_KEYWORD_OVERLAP = max(len(keyword) for keyword in _COMPETITION_KEYWORDS) - 1
+
+# Runs inside the browser and mirrors the static extraction on the live DOM
+# (strip boilerplate tags, pick the main content area, join trimmed text nodes,
+# collect capped, deduplicated links/images), so rendered pages don't need to
+# be serialized and re-parsed. Relative URLs come back already resolved.
+_DYNAMIC_EXTRACT_JS = """() => {
+    const root = document.documentElement.cloneNode(true);
+    root.querySelectorAll(%(strip)s).forEach(el => el.remove());
+    let main = null;
+    for (const selector of %(selectors)s) {
+        try { main = root.querySelector(selector); } catch (e) {}
+        if (main) break;
+    }
+    main = main || root.querySelector('body') || root;
+    const parts = [];
+    const walker = document.createTreeWalker(main, NodeFilter.SHOW_TEXT);
+    while (walker.nextNode()) {
+        const text = walker.currentNode.nodeValue.trim();
+        if (text) parts.push(text);
+    }
+    const links = new Set();
+    for (const a of root.querySelectorAll('a[href]')) {
+        if (links.size >= %(max_links)d) break;
+        links.add(a.href);
+    }
+    const images = new Set();
+    for (const img of root.querySelectorAll('img[src]')) {
+        if (images.size >= %(max_images)d) break;
+        images.add(img.src);
+    }
+    const meta = document.querySelector('meta[name="description"]');
+    return {
+        text: parts.join(' '),
+        title: document.title,
+        meta_description: meta ? (meta.getAttribute('content') || '').trim() : null,
+        links: Array.from(links),
+        images: Array.from(images)
+    };
+}""" % {
+    'strip': json.dumps(','.join(_DECOMPOSE_TAGS)),
+    'selectors': json.dumps(_MAIN_SELECTORS),
+    'max_links': _MAX_LINKS,
+    'max_images': _MAX_IMAGES
+}
+
+# Hrefs that can be resolved without urljoin: absolute http(s) URLs,
+# scheme-relative URLs and root-relative paths, with no empty query or
+# fragment and no dot segments left to normalize (checked separately)
+_PATH_CHAR = r"[\w\-.~%!$&'()*+,;=:@]"
+_SIMPLE_HREF_RE = re.compile(
+    r"(?:(?P<scheme>https?:)?//[\w.-]+(?::\d+)?|(?P<root>)(?=/(?!/)))"
+    r"(?:/" + _PATH_CHAR + r"*)*"
+    r"(?:\?[^#\s\\]+)?(?:#[^\s\\]+)?"
+)
+
+
+def _fast_join(base: ParseResult, base_url: str, href: str) -> str:
+    """
+    Resolve href against a pre-parsed base URL, equivalent to urljoin(base_url, href).
+    
+    The common absolute and root-relative forms are joined with plain string
+    operations; everything else (relative paths, dot segments, odd syntax)
+    falls back to urljoin.
+    """
+    match = _SIMPLE_HREF_RE.fullmatch(href)
+    if match is None or '/.' in href:
+        return urljoin(base_url, href)
+    if match.group('root') is not None:
+        return f"{base.scheme}://{base.netloc}{href}"
+    if match.group('scheme'):
+        return href
+    return f"{base.scheme}:{href}"
+
+
+def _parse_html(html) -> 'LexborHTMLParser':
+    """Parse an HTML document with Lexbor, failing clearly if selectolax is missing."""
+    if LexborHTMLParser is None:
+        raise ImportError("selectolax is required for HTML parsing. Please install: pip install selectolax")
+    return LexborHTMLParser(html)
+
+
+def _read_capped(response: requests.Response, limit: int) -> bytes:
+    """
+    Read at most limit + 1 bytes of decoded body, so callers can detect oversize.
+    
+    Goes through iter_content rather than response.raw: when requests-cache
+    stores a response it has already consumed the raw stream, and
+    iter_content serves the body it read instead.
+    """
+    chunks = []
+    size = 0
+    for chunk in response.iter_content(65536):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > limit:
+            break
+    return b''.join(chunks)[:limit + 1]
+
+
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ScrapingResult:
     """
     Data class to encapsulate the results of a web scraping operation.
@@ -52,6 +221,106 @@ class ScrapingResult:
     error_message: Optional[str] = None
     scraping_method: Optional[str] = None  # 'static' or 'dynamic'
     timestamp: Optional[str] = None
+    
+    def to_json(self) -> bytes:
+        """Serialize the result to UTF-8 encoded JSON, using orjson when available."""
+        if orjson is not None:
+            return orjson.dumps(self)  # orjson serializes dataclasses natively
+        return json.dumps(asdict(self), ensure_ascii=False).encode('utf-8')
+    
+    def content_fingerprint(self) -> str:
+        """
+        Fast non-cryptographic fingerprint of the extracted content.
+        
+        Used to detect that a re-scrape produced identical content so the
+        downstream steps can be skipped. The algorithm name is part of the
+        value, so fingerprints from different hash backends never match.
+        """
+        data = (self.content or '').encode('utf-8')
+        if xxhash is not None:
+            return f"xxh3_64:{xxhash.xxh3_64_hexdigest(data)}"
+        return f"blake2b:{hashlib.blake2b(data, digest_size=16).hexdigest()}"
+
+
+class _PlaywrightDynamic:
+    """
+    Playwright renderer used when the scraper's dynamic_backend is 'playwright'.
+    
+    Playwright drives Chromium over CDP directly instead of paying one WebDriver
+    HTTP round-trip per command. A single browser is kept for the scraper's
+    lifetime and every page gets a fresh context that aborts image, font and
+    stylesheet requests. Playwright's sync API is bound to the thread that
+    started it, so all work runs on one dedicated worker thread, which keeps
+    the renderer usable from asyncio.to_thread callers as well.
+    """
+    
+    _BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'stylesheet', 'media'})
+    
+    def __init__(self, timeout: float, user_agents: List[str]):
+        self.timeout_ms = timeout * 1000
+        self.user_agents = user_agents
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='playwright')
+        self._playwright = None
+        self._browser = None
+    
+    def _ensure_browser(self):
+        """Start Playwright and Chromium on first use, or relaunch a crashed browser."""
+        if self._browser is None or not self._browser.is_connected():
+            from playwright.sync_api import sync_playwright
+            if self._playwright is None:
+                self._playwright = sync_playwright().start()
+            self._browser = self._playwright.chromium.launch(headless=True)
+        return self._browser
+    
+    def _block_resources(self, route) -> None:
+        if route.request.resource_type in self._BLOCKED_RESOURCE_TYPES:
+            route.abort()
+        else:
+            route.continue_()
+    
+    def _render(self, url: str) -> Dict:
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+        
+        context = self._ensure_browser().new_context(user_agent=random.choice(self.user_agents))
+        try:
+            context.route('**/*', self._block_resources)
+            page = context.new_page()
+            page.goto(url, wait_until='domcontentloaded', timeout=self.timeout_ms)
+            try:
+                # Give client-side rendering time to fetch its data
+                page.wait_for_load_state('networkidle', timeout=self.timeout_ms)
+            except PlaywrightTimeoutError:
+                pass  # Pages that keep polling are scraped as-is
+            return page.evaluate(_DYNAMIC_EXTRACT_JS)
+        finally:
+            context.close()
+    
+    def render(self, url: str) -> Dict:
+        """
+        Render a page and extract its content in the browser.
+        
+        Args:
+            url: The URL to render
+            
+        Returns:
+            Dictionary produced by _DYNAMIC_EXTRACT_JS
+        """
+        return self._executor.submit(self._render, url).result()
+    
+    def close(self) -> None:
+        """Close the browser and stop Playwright on its owning thread."""
+        def shutdown():
+            if self._browser is not None:
+                self._browser.close()
+                self._browser = None
+            if self._playwright is not None:
+                self._playwright.stop()
+                self._playwright = None
+        
+        try:
+            self._executor.submit(shutdown).result()
+        finally:
+            self._executor.shutdown()
 
 
 class WebScraper:
@@ -78,17 +347,73 @@ class WebScraper:
         self.request_delay = self.config.get('request_delay', (2, 5))  # Random delay range
         self.timeout = self.config.get('timeout', 15)
         self.max_retries = self.config.get('max_retries', 3)
+        self.max_bytes = self.config.get('max_bytes', 4_000_000)  # Largest HTML body we'll download
+        self.probe_before_scrape = self.config.get('probe_before_scrape', True)
+        self.cache_enabled = self.config.get('cache_enabled', True)
         self.user_agents = self.config.get('user_agents', self._get_default_user_agents())
         
-        # Set up logging to track scraping operations and debug issues
-        logging.basicConfig(level=logging.INFO)
+        # Complete header sets, one per user agent, built once and shared by all
+        # requests; they are never mutated after construction
+        self._header_variants = tuple(
+            {
+                'User-Agent': user_agent,
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+                'Accept-Language': 'en-US,en;q=0.5',
+                'Accept-Encoding': _ACCEPT_ENCODING,
+                'Connection': 'keep-alive',
+                'Upgrade-Insecure-Requests': '1'
+            }
+            for user_agent in self.user_agents
+        )
+        
+        # Logger for tracking scraping operations; handlers and levels are
+        # configured by the calling workflow
         self.logger = logging.getLogger(__name__)
         
-        # Initialize session for connection reuse and cookie persistence
-        self.session = requests.Session()
+        # Initialize session for connection reuse and cookie persistence, with a
+        # larger keep-alive pool and retries with exponential backoff for
+        # transient failures (max_retries counts total attempts). With
+        # requests-cache installed, responses are also cached on disk and
+        # revalidated via ETag/Last-Modified, so unchanged pages are served
+        # locally on re-scrapes
+        if self.cache_enabled and requests_cache is not None:
+            self.session = requests_cache.CachedSession(
+                cache_name=self.config.get('cache_name', '.cache/scrape_cache'),
+                backend='sqlite',
+                expire_after=self.config.get('cache_expire_after', 3600),
+                cache_control=True,
+                stale_if_error=True,
+                filter_fn=self._is_cacheable_response
+            )
+        else:
+            self.session = requests.Session()
+        retry = Retry(
+            total=max(self.max_retries - 1, 0),
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         
-        # Selenium driver will be initialized on-demand to save resources
+        # Selenium driver (or Playwright renderer) will be initialized on-demand to save resources
         self.driver = None
+        self.dynamic_backend = self.config.get('dynamic_backend', 'selenium')
+        self._playwright = None
+    
+    def _is_cacheable_response(self, response: requests.Response) -> bool:
+        """
+        Decide whether requests-cache may store a response.
+        
+        Saving a response reads its whole body, before scrape_static_content
+        gets to apply max_bytes. Only bodies whose Content-Length is known to be
+        within the cap are cached; everything else stays a plain stream, so
+        oversized pages are still cut off after max_bytes.
+        """
+        content_length = response.headers.get('Content-Length', '')
+        return content_length.isdigit() and int(content_length) <= self.max_bytes
     
     def _get_default_user_agents(self) -> List[str]:
         """
@@ -112,14 +437,7 @@ class WebScraper:
         including Accept headers and language preferences that make
         our requests less distinguishable from human traffic.
         """
-        return {
-            'User-Agent': random.choice(self.user_agents),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        }
+        return random.choice(self._header_variants)
     
     def _random_delay(self) -> None:
         """
@@ -135,9 +453,9 @@ class WebScraper:
         
         time.sleep(delay)
     
-    def scrape_static_content(self, url: str) -> ScrapingResult:
+    def scrape_static_content(self, url: str, body: Optional[bytes] = None) -> ScrapingResult:
         """
-        Scrape content using traditional HTTP requests and BeautifulSoup parsing.
+        Scrape content using traditional HTTP requests and selectolax (Lexbor) parsing.
         
         This method is fast and resource-efficient for websites that serve
         their content directly in HTML without requiring JavaScript execution.
@@ -145,85 +463,221 @@ class WebScraper:
         
         Args:
             url: The URL to scrape
+            body: Already downloaded HTML for the URL; when given, it is
+                  parsed directly instead of fetching the page again
             
         Returns:
             ScrapingResult object containing the scraped content and metadata
         """
         self.logger.info(f"Starting static scraping for: {url}")
         
-        for attempt in range(self.max_retries):
-            try:
-                # Add delay between requests to be respectful to the server
-                if attempt > 0:
-                    self._random_delay()
-                
-                # Make the request with randomized headers
-                response = self.session.get(
-                    url,
-                    headers=self._get_random_headers(),
-                    timeout=self.timeout,
-                    allow_redirects=True
-                )
-                
+        try:
+            if body is not None:
+                return self._parse_static_html(url, body)
+            
+            # Make the request with randomized headers; transient failures
+            # (connection errors, 429 and 5xx) are retried by the session adapter
+            with self.session.get(
+                url,
+                headers=self._get_random_headers(),
+                timeout=self.timeout,
+                allow_redirects=True,
+                stream=True
+            ) as response:
                 # Check if the request was successful
                 response.raise_for_status()
                 
-                # Parse the HTML content
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Extract comprehensive information from the page
-                content = self._extract_content_from_soup(soup)
-                title = soup.find('title')
-                title_text = title.get_text().strip() if title else None
-                
-                # Extract meta description for additional context
-                meta_desc = soup.find('meta', attrs={'name': 'description'})
-                meta_description = meta_desc.get('content', '').strip() if meta_desc else None
-                
-                # Extract all links for potential follow-up scraping
-                links = [urljoin(url, link.get('href', '')) 
-                        for link in soup.find_all('a', href=True)]
-                
-                # Extract image URLs that might contain useful visual information
-                images = [urljoin(url, img.get('src', '')) 
-                         for img in soup.find_all('img', src=True)]
-                
-                self.logger.info(f"Successfully scraped {len(content)} characters from {url}")
+                # Read at most max_bytes (+1 to detect oversize) of decoded body
+                body = _read_capped(response, self.max_bytes)
+            
+            if len(body) > self.max_bytes:
+                return self._oversize_result(url)
+            
+            return self._parse_static_html(url, body)
+            
+        except requests.exceptions.RequestException as e:
+            self.logger.warning(f"Static scraping failed for {url}: {e}")
+            return ScrapingResult(
+                url=url,
+                success=False,
+                error_message=f"Static scraping failed: {str(e)}",
+                scraping_method='static',
+                timestamp=datetime.now().isoformat()
+            )
+        
+        except Exception as e:
+            self.logger.error(f"Unexpected error during static scraping: {e}")
+            return ScrapingResult(
+                url=url,
+                success=False,
+                error_message=f"Unexpected error: {str(e)}",
+                scraping_method='static',
+                timestamp=datetime.now().isoformat()
+            )
+    
+    def _probe_url(self, url: str) -> Tuple[bool, Optional[bytes], Optional[ScrapingResult]]:
+        """
+        Fetch the first 64KB of a page to decide how it should be scraped.
+        
+        A ranged GET is cheap, and small pages come back whole so the static
+        scraper can parse them without a second download. Pages whose start
+        contains a client-side app marker (root/app mount point, __NEXT_DATA__,
+        <noscript>) but almost no visible text are JavaScript shells that only
+        dynamic scraping can render.
+        
+        Args:
+            url: The URL to probe
+            
+        Returns:
+            Tuple of (looks like a JavaScript shell, full body if the probe
+            already downloaded the whole page, otherwise None, failed static
+            result if the site could not be reached at all, otherwise None)
+        """
+        headers = dict(self._get_random_headers(), Range=f'bytes=0-{_PROBE_BYTES - 1}')
+        try:
+            with self.session.get(url, headers=headers, timeout=self.timeout,
+                                  allow_redirects=True, stream=True) as response:
+                response.raise_for_status()
+                head = _read_capped(response, _PROBE_BYTES)
                 
-                return ScrapingResult(
-                    url=url,
-                    success=True,
-                    content=content,
-                    title=title_text,
-                    meta_description=meta_description,
-                    links=links[:50],  # Limit to first 50 links to avoid overwhelming data
-                    images=images[:20],  # Limit to first 20 images
-                    scraping_method='static',
-                    timestamp=datetime.now().isoformat()
+                # The probe holds the entire page if the server ignored the Range
+                # header for a small document, or the range covered all of it.
+                # Content-Range counts bytes on the wire, which differ from the
+                # decoded length when the body is compressed
+                content_range = response.headers.get('Content-Range', '')
+                complete = (
+                    (response.status_code == 200 and len(head) <= _PROBE_BYTES)
+                    or (response.status_code == 206
+                        and len(head) <= _PROBE_BYTES
+                        and content_range.rpartition('/')[2] == str(response.raw.tell()))
                 )
-                
-            except requests.exceptions.RequestException as e:
-                self.logger.warning(f"Static scraping attempt {attempt + 1} failed for {url}: {e}")
-                if attempt == self.max_retries - 1:
-                    return ScrapingResult(
-                        url=url,
-                        success=False,
-                        error_message=f"Static scraping failed after {self.max_retries} attempts: {str(e)}",
-                        scraping_method='static',
-                        timestamp=datetime.now().isoformat()
-                    )
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            # The session adapter already retried; a second request would only
+            # repeat the same retries, so this is the static attempt's result
+            self.logger.warning(f"Static scraping failed for {url}: {e}")
+            return False, None, ScrapingResult(
+                url=url,
+                success=False,
+                error_message=f"Static scraping failed: {str(e)}",
+                scraping_method='static',
+                timestamp=datetime.now().isoformat()
+            )
+        except Exception as e:
+            # Inconclusive probe, let the regular static attempt handle the page
+            self.logger.debug(f"Probe failed for {url}: {e}")
+            return False, None, None
+        
+        full_body = head if complete and len(head) <= self.max_bytes else None
+        
+        if not _SPA_MARKER_RE.search(head):
+            return False, full_body, None
+        
+        tree = _parse_html(head)
+        tree.strip_tags(list(_DECOMPOSE_TAGS) + ['noscript'])
+        body = tree.body
+        visible_text = body.text(strip=True) if body else ''
+        return len(visible_text) < _SPA_TEXT_THRESHOLD, full_body, None
+    
+    def _oversize_result(self, url: str) -> ScrapingResult:
+        """Build the failed ScrapingResult for a page larger than max_bytes."""
+        error_msg = f"Response body for {url} exceeds {self.max_bytes} bytes"
+        self.logger.warning(error_msg)
+        return ScrapingResult(
+            url=url,
+            success=False,
+            error_message=error_msg,
+            scraping_method='static',
+            timestamp=datetime.now().isoformat()
+        )
+    
+    def _parse_static_html(self, url: str, html: bytes) -> ScrapingResult:
+        """
+        Build a successful static ScrapingResult from a downloaded HTML body.
+        
+        Shared by the synchronous and asynchronous static scraping paths so
+        both extract exactly the same information from a page.
+        
+        Args:
+            url: The URL the HTML was fetched from, used to resolve relative links
+            html: Raw HTML body
             
-            except Exception as e:
-                self.logger.error(f"Unexpected error during static scraping: {e}")
-                return ScrapingResult(
-                    url=url,
-                    success=False,
-                    error_message=f"Unexpected error: {str(e)}",
-                    scraping_method='static',
-                    timestamp=datetime.now().isoformat()
-                )
+        Returns:
+            ScrapingResult object containing the scraped content and metadata
+        """
+        # Parse the raw bytes with Lexbor's C HTML5 parser
+        tree = _parse_html(html)
+        
+        # Extract comprehensive information from the page
+        content = self._extract_content_from_tree(tree)
+        title_text, meta_description, links, images = self._extract_page_metadata(tree, url)
+        
+        self.logger.info(f"Successfully scraped {len(content)} characters from {url}")
+        
+        return ScrapingResult(
+            url=url,
+            success=True,
+            content=content,
+            title=title_text,
+            meta_description=meta_description,
+            links=links,
+            images=images,
+            scraping_method='static',
+            timestamp=datetime.now().isoformat()
+        )
+    
+    def _extract_page_metadata(self, tree: 'LexborHTMLParser',
+                               base_url: str) -> Tuple[Optional[str], Optional[str], List[str], List[str]]:
+        """
+        Collect title, meta description, links and images in one document walk.
+        
+        A single combined selector visits the matching nodes in document order,
+        so the tree is traversed once instead of once per kind of element.
+        
+        Args:
+            tree: Parsed page
+            base_url: URL used to resolve relative links and image sources
+            
+        Returns:
+            Tuple of (title, meta description, first 50 unique links, first 20 unique images)
+        """
+        title = None
+        meta_description = None
+        links = []
+        images = []
+        seen_links = set()
+        seen_images = set()
+        base = urlparse(base_url)
+        
+        for node in tree.css('title, meta[name="description"], a[href], img[src]'):
+            tag = node.tag
+            if tag == 'a':
+                # Limit to first 50 unique links to avoid overwhelming data
+                if len(links) < _MAX_LINKS:
+                    link = _fast_join(base, base_url, node.attributes.get('href') or '')
+                    if link not in seen_links:
+                        seen_links.add(link)
+                        links.append(link)
+            elif tag == 'img':
+                # Limit to first 20 unique images
+                if len(images) < _MAX_IMAGES:
+                    image = _fast_join(base, base_url, node.attributes.get('src') or '')
+                    if image not in seen_images:
+                        seen_images.add(image)
+                        images.append(image)
+            elif tag == 'title':
+                if title is None:
+                    title = node.text().strip()
+            elif meta_description is None:
+                meta_description = (node.attributes.get('content') or '').strip()
+            
+            # Nothing left to collect, skip the rest of the document
+            if (len(links) >= _MAX_LINKS and len(images) >= _MAX_IMAGES
+                    and title is not None and meta_description is not None):
+                break
+        
+        return title, meta_description, links, images
     
-    def _extract_content_from_soup(self, soup: BeautifulSoup) -> str:
+    def _extract_content_from_tree(self, tree: 'LexborHTMLParser') -> str:
         """
         Extract meaningful text content from parsed HTML.
         
@@ -232,19 +686,13 @@ class WebScraper:
         that might confuse the LLM during analysis.
         """
         # Remove script and style elements that don't contain useful content
-        for script in soup(["script", "style", "nav", "footer", "header"]):
-            script.decompose()
+        tree.strip_tags(list(_DECOMPOSE_TAGS))
         
         # Try to find main content areas first
-        main_content_selectors = [
-            'main', 'article', '.content', '#content', '.main-content',
-            '.entry-content', '.post-content', '[role="main"]'
-        ]
-        
         main_content = None
-        for selector in main_content_selectors:
+        for selector in _MAIN_SELECTORS:
             try:
-                element = soup.select_one(selector)
+                element = tree.css_first(selector)
                 if element:
                     main_content = element
                     break
@@ -253,18 +701,22 @@ class WebScraper:
         
         # If no main content area found, use the entire body
         if not main_content:
-            main_content = soup.find('body') or soup
+            main_content = tree.body or tree.root
         
         # Extract text and clean it up
-        text = main_content.get_text(separator=' ', strip=True)
+        # Lexbor keeps whitespace-only nodes as empty strings, so join on a
+        # sentinel and drop those before re-joining with spaces
+        text = ' '.join(filter(None, main_content.text(separator='\x00', strip=True).split('\x00')))
         
-        # Clean up excessive whitespace
+        return self._clean_text(text)
+    
+    @staticmethod
+    def _clean_text(text: str) -> str:
+        """Drop blank lines and surrounding whitespace from extracted text."""
         lines = [line.strip() for line in text.split('\n') if line.strip()]
-        cleaned_text = '\n'.join(lines)
-        
-        return cleaned_text
+        return '\n'.join(lines)
     
-    def _initialize_selenium_driver(self) -> webdriver.Chrome:
+    def _initialize_selenium_driver(self) -> 'webdriver.Chrome':
         """
         Initialize a Selenium Chrome driver with optimized settings.
         
@@ -274,6 +726,9 @@ class WebScraper:
         if self.driver and self._is_driver_alive():
             return self.driver
         
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        
         options = Options()
         
         # Configure Chrome options for stealth and efficiency
@@ -286,6 +741,17 @@ class WebScraper:
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
         
+        # Only the DOM is needed, so skip downloading images, CSS, fonts and plugins
+        options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.managed_default_content_settings.stylesheets': 2,
+            'profile.managed_default_content_settings.fonts': 2,
+            'profile.managed_default_content_settings.plugins': 2
+        })
+        
+        # Return from driver.get() at DOMContentLoaded instead of the full load event
+        options.page_load_strategy = 'eager'
+        
         # Set a realistic user agent
         options.add_argument(f'--user-agent={random.choice(self.user_agents)}')
         
@@ -306,6 +772,32 @@ class WebScraper:
         except:
             return False
     
+    def _wait_for_network_idle(self, driver, wait_cls, idle_interval: float = 0.5) -> None:
+        """
+        Block until the page stops issuing network requests, up to self.timeout.
+        
+        Replaces a fixed sleep: fast pages continue after one quiet interval,
+        while slow single-page apps get as long as they need within the timeout.
+        
+        Args:
+            driver: Active Selenium driver
+            wait_cls: WebDriverWait class (passed in since selenium is imported lazily)
+            idle_interval: Seconds without new resource requests that count as idle
+        """
+        last_count = [-1]
+        
+        def network_idle(d) -> bool:
+            count = d.execute_script("return performance.getEntriesByType('resource').length")
+            idle = count == last_count[0]
+            last_count[0] = count
+            return idle
+        
+        try:
+            wait_cls(driver, self.timeout, poll_frequency=idle_interval).until(network_idle)
+        except Exception:
+            # Pages that never go quiet (polling, analytics beacons) are scraped as-is
+            self.logger.debug("Network did not go idle before timeout, continuing")
+    
     def scrape_dynamic_content(self, url: str) -> ScrapingResult:
         """
         Scrape content from JavaScript-heavy websites using Selenium.
@@ -322,24 +814,43 @@ class WebScraper:
         """
         self.logger.info(f"Starting dynamic scraping for: {url}")
         
+        if self.dynamic_backend == 'playwright':
+            return self._scrape_with_playwright(url)
+        
+        try:
+            from selenium.webdriver.common.by import By
+            from selenium.webdriver.support.ui import WebDriverWait
+            from selenium.webdriver.support import expected_conditions as EC
+            from selenium.common.exceptions import TimeoutException, WebDriverException
+        except ImportError as e:
+            error_msg = f"Dynamic scraping requires selenium ({e}). Please install: pip install selenium"
+            self.logger.error(error_msg)
+            return ScrapingResult(
+                url=url,
+                success=False,
+                error_message=error_msg,
+                scraping_method='dynamic',
+                timestamp=datetime.now().isoformat()
+            )
+        
         try:
             driver = self._initialize_selenium_driver()
             
             # Navigate to the page
             driver.get(url)
             
-            # Wait for the page to load completely
+            # Wait for the DOM to be ready (the driver uses the eager load strategy)
             # We use multiple strategies to detect when content is ready
             WebDriverWait(driver, self.timeout).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
+                lambda d: d.execute_script("return document.readyState") in ("interactive", "complete")
             )
             
-            # Additional wait for dynamic content to load
-            time.sleep(3)
+            # Wait for dynamic content: the page is settled once no new resources
+            # (XHR/fetch, scripts) have started between two polls
+            self._wait_for_network_idle(driver, WebDriverWait)
             
             # Try to detect if there are loading indicators and wait for them to disappear
-            loading_selectors = ['.loading', '.spinner', '[data-loading="true"]', '.loader']
-            for selector in loading_selectors:
+            for selector in _LOADING_SELECTORS:
                 try:
                     WebDriverWait(driver, 5).until_not(
                         EC.presence_of_element_located((By.CSS_SELECTOR, selector))
@@ -347,40 +858,8 @@ class WebScraper:
                 except TimeoutException:
                     pass  # Loading indicator might not exist, which is fine
             
-            # Get the fully rendered HTML
-            html_content = driver.page_source
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Extract content using the same method as static scraping
-            content = self._extract_content_from_soup(soup)
-            
-            # Get page title
-            title = driver.title
-            
-            # Extract meta description
-            meta_desc = soup.find('meta', attrs={'name': 'description'})
-            meta_description = meta_desc.get('content', '').strip() if meta_desc else None
-            
-            # Extract links and images
-            current_url = driver.current_url  # Might be different due to redirects
-            links = [urljoin(current_url, link.get('href', '')) 
-                    for link in soup.find_all('a', href=True)]
-            images = [urljoin(current_url, img.get('src', '')) 
-                     for img in soup.find_all('img', src=True)]
-            
-            self.logger.info(f"Successfully scraped {len(content)} characters using dynamic method")
-            
-            return ScrapingResult(
-                url=url,
-                success=True,
-                content=content,
-                title=title,
-                meta_description=meta_description,
-                links=links[:50],
-                images=images[:20],
-                scraping_method='dynamic',
-                timestamp=datetime.now().isoformat()
-            )
+            # Extract everything from the live DOM in a single round-trip
+            return self._build_dynamic_result(url, driver.execute_script(f"return ({_DYNAMIC_EXTRACT_JS})();"))
             
         except TimeoutException:
             error_msg = f"Page load timeout for {url}"
@@ -415,6 +894,62 @@ class WebScraper:
                 timestamp=datetime.now().isoformat()
             )
     
+    def _build_dynamic_result(self, url: str, extracted: Dict) -> ScrapingResult:
+        """
+        Build a successful dynamic ScrapingResult from in-browser extraction.
+        
+        Args:
+            url: The URL that was requested
+            extracted: Result of running _DYNAMIC_EXTRACT_JS on the rendered page
+            
+        Returns:
+            ScrapingResult object containing the scraped content and metadata
+        """
+        content = self._clean_text(extracted['text'])
+        
+        self.logger.info(f"Successfully scraped {len(content)} characters using dynamic method")
+        
+        return ScrapingResult(
+            url=url,
+            success=True,
+            content=content,
+            title=extracted['title'],
+            meta_description=extracted['meta_description'],
+            links=extracted['links'],
+            images=extracted['images'],
+            scraping_method='dynamic',
+            timestamp=datetime.now().isoformat()
+        )
+    
+    def _scrape_with_playwright(self, url: str) -> ScrapingResult:
+        """
+        Scrape a JavaScript-heavy page with the Playwright backend.
+        
+        Args:
+            url: The URL to scrape
+            
+        Returns:
+            ScrapingResult object containing the scraped content and metadata
+        """
+        try:
+            if self._playwright is None:
+                self._playwright = _PlaywrightDynamic(self.timeout, self.user_agents)
+            return self._build_dynamic_result(url, self._playwright.render(url))
+        
+        except ImportError as e:
+            error_msg = f"Dynamic scraping requires playwright ({e}). Please install: pip install playwright && playwright install chromium"
+        except Exception as e:
+            error_msg = f"Playwright error for {url}: {str(e)}"
+        
+        self.logger.error(error_msg)
+        return ScrapingResult(
+            url=url,
+            success=False,
+            error_message=error_msg,
+            scraping_method='dynamic',
+            timestamp=datetime.now().isoformat()
+        )
+    
     def scrape_url(self, url: str, force_dynamic: bool = False) -> ScrapingResult:
         """
         Main scraping method that intelligently chooses between static and dynamic approaches.
@@ -447,8 +982,21 @@ class WebScraper:
             self.logger.info("Dynamic scraping forced, skipping static attempt")
             return self.scrape_dynamic_content(url)
         
-        # Try static scraping first
-        static_result = self.scrape_static_content(url)
+        # Probe the page so JavaScript shells go straight to the dynamic scraper
+        # and small pages don't need a second download
+        dynamic_result = None
+        probed_body = None
+        probe_failure = None
+        if self.probe_before_scrape:
+            is_shell, probed_body, probe_failure = self._probe_url(url)
+            if is_shell:
+                self.logger.info("Probe found a JavaScript application shell, trying dynamic scraping first")
+                dynamic_result = self.scrape_dynamic_content(url)
+                if dynamic_result.success:
+                    return dynamic_result
+        
+        # Try static scraping first, unless the probe already failed to reach the site
+        static_result = probe_failure or self.scrape_static_content(url, body=probed_body)
         
         # Evaluate if static scraping was successful and sufficient
         if static_result.success and self._is_content_sufficient(static_result.content):
@@ -456,8 +1004,9 @@ class WebScraper:
             return static_result
         
         # Static scraping failed or content was insufficient, try dynamic
-        self.logger.info("Static scraping insufficient, attempting dynamic scraping")
-        dynamic_result = self.scrape_dynamic_content(url)
+        if dynamic_result is None:
+            self.logger.info("Static scraping insufficient, attempting dynamic scraping")
+            dynamic_result = self.scrape_dynamic_content(url)
         
         # Return the better result (dynamic if it worked, otherwise static with error info)
         if dynamic_result.success:
@@ -481,18 +1030,18 @@ class WebScraper:
         if len(content.strip()) < 500:
             return False
         
-        # Look for indicators of successful content extraction
-        competition_keywords = [
-            'competition', 'apply', 'application', 'deadline', 'prize', 'eligibility',
-            'requirements', 'submit', 'participants', 'winner', 'startup', 'innovation',
-            'entrepreneur', 'funding', 'investment', 'accelerator'
-        ]
-        
-        content_lower = content.lower()
-        keyword_matches = sum(1 for keyword in competition_keywords if keyword in content_lower)
+        # Look for indicators of successful content extraction; content should
+        # contain at least a few distinct relevant keywords
+        found = set()
+        for start in range(0, len(content), _KEYWORD_WINDOW):
+            window = content[max(start - _KEYWORD_OVERLAP, 0):start + _KEYWORD_WINDOW].lower()
+            for keyword in _COMPETITION_KEYWORDS:
+                if keyword not in found and keyword in window:
+                    found.add(keyword)
+                    if len(found) >= 3:
+                        return True
         
-        # Content should contain at least a few relevant keywords
-        return keyword_matches >= 3
+        return False
     
     def scrape_multiple_urls(self, urls: List[str]) -> List[ScrapingResult]:
         """
@@ -515,9 +1064,81 @@ class WebScraper:
         
         return results
     
+    async def scrape_multiple_urls_async(self, urls: List[str], max_concurrency: int = 32) -> List[ScrapingResult]:
+        """
+        Scrape multiple URLs concurrently with aiohttp.
+        
+        Static fetches run concurrently over one shared aiohttp session, with
+        HTML parsing offloaded to worker threads so it doesn't block the event
+        loop. Pages whose static content is missing or insufficient then fall
+        back to dynamic scraping one at a time, since the Selenium driver is
+        shared and not thread-safe.
+        
+        Args:
+            urls: The URLs to scrape
+            max_concurrency: Maximum number of in-flight static requests
+            
+        Returns:
+            List of ScrapingResult objects in the same order as ``urls``
+        """
+        import aiohttp
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        connector = aiohttp.TCPConnector(limit=100, limit_per_host=8, ttl_dns_cache=300, keepalive_timeout=60)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        
+        async def fetch(session: 'aiohttp.ClientSession', url: str) -> ScrapingResult:
+            parsed_url = urlparse(url)
+            if not all([parsed_url.scheme, parsed_url.netloc]):
+                return ScrapingResult(
+                    url=url,
+                    success=False,
+                    error_message="Invalid URL format",
+                    timestamp=datetime.now().isoformat()
+                )
+            
+            async with semaphore:
+                try:
+                    self.logger.info(f"Starting async static scraping for: {url}")
+                    async with session.get(url, headers=self._get_random_headers(), allow_redirects=True) as response:
+                        response.raise_for_status()
+                        body = bytearray()
+                        async for chunk in response.content.iter_chunked(65536):
+                            body += chunk
+                            if len(body) > self.max_bytes:
+                                return self._oversize_result(url)
+                    return await asyncio.to_thread(self._parse_static_html, url, bytes(body))
+                except Exception as e:
+                    self.logger.warning(f"Async static scraping failed for {url}: {e}")
+                    return ScrapingResult(
+                        url=url,
+                        success=False,
+                        error_message=f"Static scraping failed: {str(e)}",
+                        scraping_method='static',
+                        timestamp=datetime.now().isoformat()
+                    )
+        
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            results = list(await asyncio.gather(*[fetch(session, url) for url in urls]))
+        
+        for i, result in enumerate(results):
+            if result.success and self._is_content_sufficient(result.content):
+                continue
+            if result.error_message == "Invalid URL format":
+                continue
+            
+            self.logger.info(f"Static scraping insufficient for {result.url}, attempting dynamic scraping")
+            dynamic_result = await asyncio.to_thread(self.scrape_dynamic_content, result.url)
+            if dynamic_result.success:
+                results[i] = dynamic_result
+            else:
+                result.error_message = f"Both static and dynamic scraping failed. Static: {result.error_message}, Dynamic: {dynamic_result.error_message}"
+        
+        return results
+    
     def close(self) -> None:
         """
-        Clean up resources, particularly the Selenium driver.
+        Clean up resources, particularly the Selenium driver or Playwright browser.
         
         This method should be called when scraping is complete to free up
         system resources and properly close browser instances.
@@ -531,6 +1152,15 @@ class WebScraper:
             finally:
                 self.driver = None
         
+        if self._playwright:
+            try:
+                self._playwright.close()
+                self.logger.info("Playwright browser closed successfully")
+            except Exception as e:
+                self.logger.warning(f"Error closing Playwright browser: {e}")
+            finally:
+                self._playwright = None
+        
         # Close the requests session
         self.session.close()
     
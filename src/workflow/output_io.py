@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Output File Helpers
+
+Serialization and file writing shared by the scraping and workflow steps, so
+every JSON file the workflow produces is written the same way.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    # Optional speedup; fall back to stdlib json when orjson isn't installed
+    orjson = None
+
+
+def dumps_json(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize obj as UTF-8 JSON, compact unless pretty, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def write_bytes(path: Path, data: bytes) -> None:
+    """Write data to path in a single buffered write."""
+    with open(path, 'wb', buffering=65536) as f:
+        f.write(data)
@@ -7,12 +7,25 @@ Reads configuration, executes scraping, and saves structured results.
 """
 
 import json
+import asyncio
 import os
 import sys
+import queue
+import atexit
+import time
 import logging
+import logging.handlers
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlparse
 from datetime import datetime
+
+try:
+    import uvloop
+except ImportError:
+    # Optional; asyncio's default event loop is used when it isn't installed
+    uvloop = None
+
 # Add src directory to path for imports
 current_dir = Path(__file__).parent
 src_dir = current_dir.parent  # Go up from workflow/ to src/
@@ -21,6 +34,7 @@ if str(src_dir) not in sys.path:
 
 try:
     from scraper.web_scraper import WebScraper, ScrapingResult
+    from workflow.output_io import dumps_json, write_bytes
 except ImportError as e:
     print(f"Error importing scraper module: {e}")
     print("Make sure web_scraper.py is in src/scraper/ directory")
@@ -58,14 +72,26 @@ class CompetitionScraper:
         log_level = self.config.get('logging', {}).get('level', 'INFO')
         log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         
+        # Callers only enqueue records; a background listener does the console
+        # and file I/O so logging stays off the hot path
+        log_queue = queue.Queue(-1)
+        log_handler = logging.handlers.QueueHandler(log_queue)
+        listener = logging.handlers.QueueListener(
+            log_queue,
+            logging.StreamHandler(),
+            logging.FileHandler('logs/scraper.log', encoding='utf-8', delay=True)
+        )
+        
         logging.basicConfig(
             level=getattr(logging, log_level.upper()),
             format=log_format,
-            handlers=[
-                logging.StreamHandler(),
-                logging.FileHandler('logs/scraper.log', encoding='utf-8')
-            ]
+            handlers=[log_handler]
         )
+        
+        # Only start the listener if basicConfig actually installed our handler
+        if log_handler in logging.getLogger().handlers:
+            listener.start()
+            atexit.register(listener.stop)
         self.logger = logging.getLogger(__name__)
     
     def get_target_url(self) -> str:
@@ -82,15 +108,75 @@ class CompetitionScraper:
         output_dir.mkdir(parents=True, exist_ok=True)
         return output_dir
     
+    def has_fresh_result(self, output_dir: Path) -> bool:
+        """Check whether a successful scrape of the target URL was saved within result_cache_ttl seconds."""
+        ttl = self.config.get('result_cache_ttl', 600)
+        if ttl <= 0:
+            return False
+        
+        try:
+            age = time.time() - (output_dir / 'scraped_content.txt').stat().st_mtime
+            with open(output_dir / 'workflow_state.json', 'r', encoding='utf-8') as f:
+                metadata = json.load(f).get('metadata', {})
+        except (OSError, json.JSONDecodeError, AttributeError):
+            return False
+        
+        return age < ttl and metadata.get('success') is True and metadata.get('url') == self.target_url
+    
+    def get_internal_links(self, result: ScrapingResult) -> List[str]:
+        """Collect unique same-site links from a scraped page, up to max_followed_links."""
+        preferences = self.config.get('extraction_preferences', {})
+        limit = preferences.get('max_followed_links', 10)
+        host = urlparse(result.url).netloc
+        
+        links = []
+        for link in result.links or []:
+            parsed = urlparse(link)
+            if parsed.scheme not in ('http', 'https') or parsed.netloc != host:
+                continue
+            url = parsed._replace(fragment='').geturl()
+            if url != result.url and url not in links:
+                links.append(url)
+                if len(links) >= limit:
+                    break
+        return links
+    
+    def scrape_many(self, scraper: WebScraper, urls: List[str]) -> List[ScrapingResult]:
+        """Scrape several URLs concurrently over one shared aiohttp session."""
+        coro = scraper.scrape_multiple_urls_async(urls, max_concurrency=8)
+        if uvloop is not None:
+            # Run on the libuv-based event loop when it's installed
+            return uvloop.run(coro)
+        return asyncio.run(coro)
+    
+    def merge_linked_pages(self, scraper: WebScraper, result: ScrapingResult) -> None:
+        """Scrape the page's internal links concurrently and append their content to the result."""
+        linked_urls = self.get_internal_links(result)
+        if not linked_urls:
+            return
+        
+        self.logger.info(f"Scraping {len(linked_urls)} linked pages concurrently")
+        try:
+            pages = self.scrape_many(scraper, linked_urls)
+        except ImportError as e:
+            self.logger.warning(f"Skipping linked pages, concurrent scraping requires aiohttp: {e}")
+            return
+        
+        sections = [result.content or '']
+        for page in pages:
+            if page.success and page.content:
+                sections.append(f"--- {page.url} ---\n{page.content}")
+            else:
+                self.logger.warning(f"Failed to scrape linked page {page.url}: {page.error_message}")
+        result.content = '\n\n'.join(sections)
+    
     def save_scraping_result(self, result: ScrapingResult, output_dir: Path) -> None:
         """Save scraping results to structured files."""
         
-        # Save main content as text file
-        content_file = output_dir / 'scraped_content.txt'
-        with open(content_file, 'w', encoding='utf-8') as f:
-            f.write(result.content or "No content extracted")
+        # Main content as text file
+        write_bytes(output_dir / 'scraped_content.txt', (result.content or "No content extracted").encode('utf-8'))
         
-        # Save metadata as JSON
+        # Metadata, links and images together in one JSON state file
         metadata = {
             'url': result.url,
             'success': result.success,
@@ -101,23 +187,16 @@ class CompetitionScraper:
             'error_message': result.error_message,
             'links_count': len(result.links or []),
             'images_count': len(result.images or []),
-            'content_length': len(result.content or '')
+            'content_length': len(result.content or ''),
+            'content_fingerprint': result.content_fingerprint()
         }
-        
-        metadata_file = output_dir / 'scraping_metadata.json'
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
-        
-        # Save links and images if available
-        if result.links:
-            links_file = output_dir / 'extracted_links.json'
-            with open(links_file, 'w', encoding='utf-8') as f:
-                json.dump(result.links, f, indent=2, ensure_ascii=False)
-        
-        if result.images:
-            images_file = output_dir / 'extracted_images.json'
-            with open(images_file, 'w', encoding='utf-8') as f:
-                json.dump(result.images, f, indent=2, ensure_ascii=False)
+        state = {
+            'metadata': metadata,
+            'links': result.links or [],
+            'images': result.images or []
+        }
+        # JSON is only pretty-printed in debug mode
+        write_bytes(output_dir / 'workflow_state.json', dumps_json(state, self.config.get('debug', False)))
         
         self.logger.info(f"Scraping results saved to {output_dir}")
     
@@ -132,9 +211,22 @@ class CompetitionScraper:
             self.logger.info(f"Starting scraping workflow for: {target_url}")
             self.logger.info(f"Output directory: {output_dir}")
             
+            # Skip the network entirely when this URL was scraped moments ago;
+            # older pages are revalidated through the scraper's HTTP cache
+            if self.has_fresh_result(output_dir):
+                self.logger.info("Recent scraping results found, skipping scraping")
+                print(f" Reusing recent results for {target_url}")
+                print(f" Results saved to: {output_dir}")
+                return True
+            
             # Execute scraping
             with WebScraper(scraper_config) as scraper:
                 result = scraper.scrape_url(target_url)
+                
+                # Optionally pull in sub-pages (FAQ, rules, ...) linked from the main page
+                follow_links = self.config.get('extraction_preferences', {}).get('follow_internal_links', False)
+                if result.success and follow_links:
+                    self.merge_linked_pages(scraper, result)
             
             # Save results
             self.save_scraping_result(result, output_dir)
@@ -170,7 +262,7 @@ def get_user_inputs() -> tuple[str, str]:
         target_url = input("Enter competition website URL: ").strip()
         if target_url:
             # Basic URL validation
-            if not (target_url.startswith('http://') or target_url.startswith('https://')):
+            if urlparse(target_url).scheme not in ('http', 'https'):
                 target_url = 'https://' + target_url
             break
         print(" URL cannot be empty. Please try again.")
@@ -8,25 +8,77 @@ Orchestrates the complete competition application automation workflow:
 3. LLM-powered application generation
 """
 
+import re
 import yaml
 import sys
+import shutil
+import hashlib
+import queue
+import atexit
 import logging
+import logging.handlers
 from pathlib import Path
-from typing import Dict, Any, Optional
+from urllib.parse import urlparse
+from typing import BinaryIO, Dict, Any, Optional, Tuple
 from datetime import datetime
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
-# Add src directory to path
+try:
+    import orjson
+except ImportError:
+    # Optional speedup; fall back to stdlib json when orjson isn't installed
+    orjson = None
+    import json
+
+from workflow.output_io import dumps_json, write_bytes
+
+# libyaml's C loader parses ~10x faster; same safe semantics as SafeLoader
+_YAML_LOADER = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+
+# Prompt template placeholders, substituted in a single pass
+_PLACEHOLDER_RE = re.compile(r'\{(COMPETITION_NAME|TIMESTAMP|reference_data|history_data)\}')
+
+# Generated applications keyed by prompt hash, reused when a prompt repeats
+_LLM_CACHE_DIR = Path('logs') / 'llm_cache'
+
+# Set once main() has created the working directories
+_DIRS_READY = False
+
+# Add src directory to path; the scraper and API modules are imported lazily
+# in the steps that use them, so the input prompt appears without their load cost
 current_dir = Path(__file__).parent
 src_dir = current_dir / 'src'
 sys.path.insert(0, str(src_dir))
 
-try:
-    from scraper.web_scraper import WebScraper
-    from scraper.content_parser import ContentParser, MonicaAIClient
-    from api.monica_client import MonicaClient
-except ImportError as e:
-    print(f"Error importing modules: {e}")
-    sys.exit(1)
+
+@lru_cache(maxsize=128)
+def _read_text_cached(path: str, mtime_ns: int, size: int) -> str:
+    """Read a UTF-8 text file; keyed on mtime and size so edits invalidate the entry."""
+    return Path(path).read_text(encoding='utf-8')
+
+
+def _read_text(path: Path) -> str:
+    """Read a UTF-8 text file, reusing the in-memory copy while it is unchanged on disk."""
+    st = path.stat()
+    return _read_text_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+def _try_read_text(file_path: str) -> Tuple[Optional[str], Optional[Exception]]:
+    """
+    Read a reference file without raising, for use from worker threads.
+    
+    Returns:
+        Tuple of (content, error): content is None if the file is missing
+        (error is None) or unreadable (error is set)
+    """
+    full_path = Path(file_path)
+    if not full_path.exists():
+        return None, None
+    try:
+        return _read_text(full_path), None
+    except Exception as e:
+        return None, e
 
 
 class WorkflowExecutor:
@@ -36,12 +88,17 @@ class WorkflowExecutor:
         self.config_path = Path(config_path)
         self.config = self.load_config()
         self.setup_logging()
+        # Per-competition directories, built once per competition name
+        self._base_input = Path(self.config['paths']['input_base'])
+        self._base_output = Path(self.config['paths']['output_base'])
+        self._info_dirs: Dict[str, Path] = {}
+        self._output_dirs: Dict[str, Path] = {}
         
     def load_config(self) -> Dict[str, Any]:
         """Load workflow configuration from YAML file."""
         try:
             with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=_YAML_LOADER)
             return config
         except FileNotFoundError:
             print(f"Configuration file not found: {self.config_path}")
@@ -57,16 +114,42 @@ class WorkflowExecutor:
         # Ensure logs directory exists
         Path('logs').mkdir(exist_ok=True)
         
+        # Callers only enqueue records; a background listener does the console
+        # and file I/O so logging stays off the hot path
+        log_queue = queue.Queue(-1)
+        log_handler = logging.handlers.QueueHandler(log_queue)
+        listener = logging.handlers.QueueListener(
+            log_queue,
+            logging.StreamHandler(),
+            logging.FileHandler('logs/workflow.log', encoding='utf-8', delay=True)
+        )
+        
         logging.basicConfig(
             level=getattr(logging, log_level.upper()),
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.StreamHandler(),
-                logging.FileHandler('logs/workflow.log', encoding='utf-8')
-            ]
+            handlers=[log_handler]
         )
+        
+        # Only start the listener if basicConfig actually installed our handler
+        if log_handler in logging.getLogger().handlers:
+            listener.start()
+            atexit.register(listener.stop)
         self.logger = logging.getLogger(__name__)
     
+    def competition_info_dir(self, competition_name: str) -> Path:
+        """Return the competition_info input directory for a competition."""
+        info_dir = self._info_dirs.get(competition_name)
+        if info_dir is None:
+            info_dir = self._info_dirs[competition_name] = self._base_input / competition_name / 'competition_info'
+        return info_dir
+    
+    def competition_output_dir(self, competition_name: str) -> Path:
+        """Return the output directory for a competition."""
+        output_dir = self._output_dirs.get(competition_name)
+        if output_dir is None:
+            output_dir = self._output_dirs[competition_name] = self._base_output / competition_name
+        return output_dir
+    
     def get_user_inputs(self) -> tuple[str, str]:
         """Get competition name and URL from user."""
         print("Competition Application Automation Workflow")
@@ -81,7 +164,7 @@ class WorkflowExecutor:
         while True:
             target_url = input("Enter competition website URL: ").strip()
             if target_url:
-                if not (target_url.startswith('http://') or target_url.startswith('https://')):
+                if urlparse(target_url).scheme not in ('http', 'https'):
                     target_url = 'https://' + target_url
                 break
             print("❌ URL cannot be empty.")
@@ -101,10 +184,12 @@ class WorkflowExecutor:
         self.logger.info("Step 1: Executing web scraping")
         
         try:
+            from scraper.web_scraper import WebScraper
+            
             scraper_config = self.config.get('scraper_settings', {})
             
             # Create output directory
-            output_dir = Path(self.config['paths']['input_base']) / competition_name / 'competition_info'
+            output_dir = self.competition_info_dir(competition_name)
             output_dir.mkdir(parents=True, exist_ok=True)
             
             # Execute scraping
@@ -116,9 +201,10 @@ class WorkflowExecutor:
                 return False
             
             # Save results manually to competition_info directory
+            # Encode once and hand the bytes over in a single write, skipping the text layer
             content_file = output_dir / 'scraped_content.txt'
-            with open(content_file, 'w', encoding='utf-8') as f:
-                f.write(result.content or "No content extracted")
+            with open(content_file, 'wb', buffering=1 << 20) as f:
+                f.write((result.content or "No content extracted").encode('utf-8'))
             
             metadata = {
                 'url': result.url,
@@ -130,13 +216,23 @@ class WorkflowExecutor:
                 'error_message': result.error_message,
                 'links_count': len(result.links or []),
                 'images_count': len(result.images or []),
-                'content_length': len(result.content or '')
+                'content_length': len(result.content or ''),
+                'content_fingerprint': result.content_fingerprint()
             }
             
-            metadata_file = output_dir / 'scraping_metadata.json'
-            import json
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+            # Metadata, links and images go into one state file; compact JSON unless debugging
+            state_file = output_dir / 'workflow_state.json'
+            state = {
+                'metadata': metadata,
+                'links': result.links or [],
+                'images': result.images or []
+            }
+            # Keep the fingerprint of the content the saved parsed info came from,
+            # so the parsing step can tell whether that info is still current
+            parsed_fingerprint = self._load_state(state_file).get('parsed_fingerprint')
+            if parsed_fingerprint:
+                state['parsed_fingerprint'] = parsed_fingerprint
+            write_bytes(state_file, dumps_json(state, self.config.get('debug', False)))
             
             self.logger.info("✅ Scraping completed successfully")
             return True
@@ -145,30 +241,51 @@ class WorkflowExecutor:
             self.logger.error(f"Scraping step failed: {e}")
             return False
     
+    def _load_state(self, state_file: Path) -> Dict[str, Any]:
+        """Return the saved workflow state, or an empty dict if it is missing or unreadable."""
+        try:
+            raw = state_file.read_bytes()
+            state = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except (OSError, ValueError):
+            return {}
+        return state if isinstance(state, dict) else {}
+    
     def execute_parsing(self, competition_name: str) -> bool:
         """Execute content parsing step."""
         self.logger.info("Step 2: Executing content parsing")
         
         try:
             # Read scraped content
-            input_dir = Path(self.config['paths']['input_base']) / competition_name / 'competition_info'
+            input_dir = self.competition_info_dir(competition_name)
             content_file = input_dir / 'scraped_content.txt'
             
             if not content_file.exists():
                 self.logger.error(f"Scraped content not found: {content_file}")
                 return False
             
-            with open(content_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # The parsed info is still valid if it was produced from this exact content
+            state_file = input_dir / 'workflow_state.json'
+            state = self._load_state(state_file)
+            metadata = state.get('metadata')
+            fingerprint = metadata.get('content_fingerprint') if isinstance(metadata, dict) else None
+            parsed_info_file = input_dir / 'parsed_competition_info.json'
+            if fingerprint and fingerprint == state.get('parsed_fingerprint') and parsed_info_file.exists():
+                self.logger.info("✅ Scraped content unchanged since last parse, reusing parsed competition info")
+                return True
+            
+            content = _read_text(content_file)
+            
+            from scraper.content_parser import ContentParser, MonicaAIClient
             
             # Initialize parser with Monica AI client
             llm_config = self.config.get('llm_settings', {})
             llm_client = MonicaAIClient(
                 api_key=llm_config['api_key'],
                 base_url=llm_config['base_url'],
-                model=llm_config['model']
+                model=llm_config['model'],
+                verify_ssl=llm_config.get('verify_ssl', True)
             )
-            parser = ContentParser(llm_client=llm_client)
+            parser = ContentParser(llm_client=llm_client, config=self.config.get('parser_settings', {}))
             
             # Parse content
             parsed_info = parser.parse_content(content)
@@ -176,6 +293,15 @@ class WorkflowExecutor:
             # Save parsed information
             parser.save_to_competition_dir(parsed_info, competition_name, self.config['paths']['input_base'])
             
+            # Only an LLM parse is worth reusing; after the rule-based fallback the
+            # next run must try again, even if the content hasn't changed
+            if fingerprint and parsed_info.parsing_method == 'llm':
+                state['parsed_fingerprint'] = fingerprint
+            else:
+                state.pop('parsed_fingerprint', None)
+            if state:
+                write_bytes(state_file, dumps_json(state, self.config.get('debug', False)))
+            
             self.logger.info("✅ Content parsing completed successfully")
             return True
             
@@ -188,8 +314,8 @@ class WorkflowExecutor:
         prompt_path = Path(self.config['paths']['prompt_template'])
         
         try:
-            with open(prompt_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            # Served from the process-wide read cache until the file changes on disk
+            return _read_text(prompt_path)
         except FileNotFoundError:
             self.logger.error(f"Prompt template not found: {prompt_path}")
             raise
@@ -199,33 +325,35 @@ class WorkflowExecutor:
         docs = {}
         
         # Load parsed competition info
-        parsed_info_path = Path(self.config['paths']['input_base']) / competition_name / 'competition_info' / 'parsed_competition_info.json'
+        info_dir = self.competition_info_dir(competition_name)
+        parsed_info_path = info_dir / 'parsed_competition_info.json'
         if parsed_info_path.exists():
-            with open(parsed_info_path, 'r', encoding='utf-8') as f:
-                import json
-                docs['competition_info'] = json.load(f)
+            raw = _read_text(parsed_info_path)
+            docs['competition_info'] = orjson.loads(raw) if orjson is not None else json.loads(raw)
         
-        # Load scraped content
-        content_path = Path(self.config['paths']['input_base']) / competition_name / 'competition_info' / 'scraped_content.txt'
+        # Load scraped content; the read cache returns the copy read during
+        # parsing unless the file has been rewritten since
+        content_path = info_dir / 'scraped_content.txt'
         if content_path.exists():
-            with open(content_path, 'r', encoding='utf-8') as f:
-                docs['scraped_content'] = f.read()
+            docs['scraped_content'] = _read_text(content_path)
         
-        # Load reference documentation from multiple files
+        # Load reference documentation from multiple files, reading them
+        # concurrently; warnings are logged afterwards in file order
         reference_docs = self.config.get('reference_docs', {})
+        file_paths = [file_path for file_list in reference_docs.values() for file_path in file_list]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            loaded = dict(zip(file_paths, executor.map(_try_read_text, file_paths)))
+        
         for category, file_list in reference_docs.items():
             category_content = []
             for file_path in file_list:
-                full_path = Path(file_path)
-                if full_path.exists():
-                    try:
-                        with open(full_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            category_content.append(f"## {full_path.name}\n{content}")
-                    except Exception as e:
-                        self.logger.warning(f"Failed to read {file_path}: {e}")
-                else:
+                content, error = loaded[file_path]
+                if content is not None:
+                    category_content.append(f"## {Path(file_path).name}\n{content}")
+                elif error is None:
                     self.logger.warning(f"Reference file not found: {file_path}")
+                else:
+                    self.logger.warning(f"Failed to read {file_path}: {error}")
             
             if category_content:
                 docs[f'reference_{category}'] = '\n\n'.join(category_content)
@@ -246,16 +374,46 @@ class WorkflowExecutor:
             # Construct final prompt
             final_prompt = self.construct_final_prompt(prompt_template, reference_docs, competition_name)
             
-            # Execute LLM call (placeholder for now)
-            application_content = self.call_llm_for_application(final_prompt)
-            
-            # Save output
-            output_dir = Path(self.config['paths']['output_base']) / competition_name
+            output_dir = self.competition_output_dir(competition_name)
             output_dir.mkdir(parents=True, exist_ok=True)
-            
             output_file = output_dir / f"{competition_name}_application.md"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(application_content)
+            
+            # Reuse the output of an earlier run with a byte-identical prompt
+            cache_path = self._llm_cache_path(final_prompt)
+            if cache_path is not None and cache_path.exists():
+                shutil.copyfile(cache_path, output_file)  # in-kernel copy on Linux (sendfile)
+                self.logger.info(f"✅ Prompt unchanged, reused cached application from {cache_path}")
+                return True
+            
+            # Execute LLM call, writing the output as it is generated so no
+            # large write is left for the end of the step
+            with open(output_file, 'wb', buffering=1 << 16) as f:
+                failure = None
+                try:
+                    generated = self.stream_llm_for_application(final_prompt, f)
+                except Exception as e:
+                    generated, failure = False, e
+                
+                if not generated:
+                    f.seek(0)
+                    f.truncate()
+                    if failure is None:
+                        # Streaming disabled or interrupted; start over with a buffered call
+                        try:
+                            application_content = self.call_llm_for_application(final_prompt, raise_errors=True)
+                            generated = True
+                        except Exception as e:
+                            application_content = self._generation_failure_notice(final_prompt, e)
+                    else:
+                        application_content = self._generation_failure_notice(final_prompt, failure)
+                    f.write(application_content.encode('utf-8'))
+            
+            # Only successful generations are cached, never the failure notice
+            if generated and cache_path is not None:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_suffix('.tmp')
+                shutil.copyfile(output_file, tmp_path)
+                tmp_path.replace(cache_path)
             
             self.logger.info(f"✅ Application generated and saved to {output_file}")
             return True
@@ -264,54 +422,139 @@ class WorkflowExecutor:
             self.logger.error(f"Application generation failed: {e}")
             return False
     
-    def construct_final_prompt(self, template: str, reference_docs: Dict[str, str], competition_name: str) -> str:
-        # 替换基本占位符
-        prompt = template.replace("{COMPETITION_NAME}", competition_name)
-        prompt = prompt.replace("{TIMESTAMP}", datetime.now().isoformat())
+    def _llm_cache_path(self, prompt: str) -> Optional[Path]:
+        """
+        Locate the cached LLM output for a prompt.
         
+        The key covers the prompt and the generation parameters, so changing
+        the model, temperature or token limit also misses the cache.
+        
+        Returns:
+            Path of the cache entry (which may not exist yet), or None when
+            output caching is disabled
+        """
+        llm_config = self.config.get('llm_settings', {})
+        if not llm_config.get('cache_outputs', True):
+            return None
+        
+        digest = hashlib.blake2b(digest_size=16)
+        params = f"{llm_config.get('model', 'gpt-4.1')}\0{llm_config.get('temperature', 0.7)}\0{llm_config.get('max_tokens', 4000)}\0"
+        digest.update(params.encode('utf-8'))
+        digest.update(prompt.encode('utf-8'))
+        return _LLM_CACHE_DIR / f"{digest.hexdigest()}.md"
+    
+    def construct_final_prompt(self, template: str, reference_docs: Dict[str, str], competition_name: str) -> str:
         # 构建参考数据字符串
-        reference_data = ""
-        for key, content in reference_docs.items():
-            reference_data += f"\n## {key}\n{content}\n"
+        reference_data = ''.join(f"\n## {key}\n{content}\n" for key, content in reference_docs.items())
         
-        prompt = prompt.replace("{reference_data}", reference_data)
-        prompt = prompt.replace("{history_data}", "")  # 暂时为空
+        # 一次扫描替换所有占位符
+        subs = {
+            'COMPETITION_NAME': competition_name,
+            'TIMESTAMP': datetime.now().isoformat(),
+            'reference_data': reference_data,
+            'history_data': ''  # 暂时为空
+        }
+        return _PLACEHOLDER_RE.sub(lambda m: subs[m.group(1)], template)
+    
+    def stream_llm_for_application(self, prompt: str, out: BinaryIO) -> bool:
+        """
+        Stream Monica AI application content into out as it is generated.
+        
+        Args:
+            prompt: Final application prompt
+            out: Binary file object receiving UTF-8 encoded content
+            
+        Returns:
+            bool: True if the full response was written, False if streaming is
+                  disabled or failed in a way a buffered call may not (out may
+                  then hold partial content)
+            
+        Raises:
+            Exception: When the API call fails for reasons unrelated to streaming
+        """
+        llm_config = self.config.get('llm_settings', {})
+        if not llm_config.get('stream', True):
+            return False
+        
+        from api.monica_client import MonicaClient, StreamingError
         
-        return prompt
+        self.logger.info(f"Streaming Monica AI application content with prompt length: {len(prompt)}")
+        written = 0
+        
+        try:
+            with MonicaClient(
+                base_url=llm_config.get('base_url', 'https://openapi.monica.im/v1'),
+                api_key=llm_config.get('api_key'),
+                model=llm_config.get('model', 'gpt-4.1'),
+                verify_ssl=llm_config.get('verify_ssl', True)
+            ) as monica_client:
+                for chunk in monica_client.complete_stream(
+                    prompt=prompt,
+                    temperature=llm_config.get('temperature', 0.7),
+                    max_tokens=llm_config.get('max_tokens', 4000),
+                    retry_attempts=3,
+                    retry_delay=5
+                ):
+                    out.write(chunk.encode('utf-8'))
+                    out.flush()
+                    written += len(chunk)
+            
+        except StreamingError as e:
+            self.logger.warning(f"Streaming generation failed after {written} characters, falling back to buffered call: {e}")
+            return False
+        except Exception as e:
+            # The API itself is failing; a buffered call would only repeat the same retries
+            self.logger.error(f"Failed to generate application content: {e}")
+            raise
+        
+        if not written:
+            self.logger.warning("Streaming generation returned no content, falling back to buffered call")
+            return False
+        
+        self.logger.info(f"Successfully generated application content ({written} characters)")
+        return True
     
-    def call_llm_for_application(self, prompt: str) -> str:
-        """Call Monica AI to generate application content."""
+    def call_llm_for_application(self, prompt: str, raise_errors: bool = False) -> str:
+        """Call Monica AI to generate application content (a failure notice on error unless raise_errors)."""
         self.logger.info(f"Calling Monica AI for application generation with prompt length: {len(prompt)}")
         
         try:
+            from api.monica_client import MonicaClient
+            
             # Get LLM configuration
             llm_config = self.config.get('llm_settings', {})
             
             # Create Monica client using your custom implementation
-            monica_client = MonicaClient(
+            with MonicaClient(
                 base_url=llm_config.get('base_url', 'https://openapi.monica.im/v1'),
                 api_key=llm_config.get('api_key'),
-                model=llm_config.get('model', 'gpt-4.1')
-            )
-            
-            # Call the API with configuration parameters
-            application_content = monica_client.complete(
-                prompt=prompt,
-                temperature=llm_config.get('temperature', 0.7),
-                max_tokens=llm_config.get('max_tokens', 4000),
-                retry_attempts=3,
-                retry_delay=5
-            )
+                model=llm_config.get('model', 'gpt-4.1'),
+                verify_ssl=llm_config.get('verify_ssl', True)
+            ) as monica_client:
+                # Call the API with configuration parameters
+                application_content = monica_client.complete(
+                    prompt=prompt,
+                    temperature=llm_config.get('temperature', 0.7),
+                    max_tokens=llm_config.get('max_tokens', 4000),
+                    retry_attempts=3,
+                    retry_delay=5
+                )
             
             self.logger.info(f"Successfully generated application content ({len(application_content)} characters)")
             return application_content
             
         except Exception as e:
             self.logger.error(f"Failed to generate application content: {e}")
+            if raise_errors:
+                raise
             # Return a fallback message instead of crashing
-            return f"""# Application Generation Failed
+            return self._generation_failure_notice(prompt, e)
+    
+    def _generation_failure_notice(self, prompt: str, error: Exception) -> str:
+        """Build the markdown written in place of the application when generation fails."""
+        return f"""# Application Generation Failed
 
-An error occurred while generating the application content: {str(e)}
+An error occurred while generating the application content: {str(error)}
 
 **Original prompt length:** {len(prompt)} characters
 **Error timestamp:** {datetime.now().isoformat()}
@@ -362,9 +605,13 @@ Please check the logs for more details and verify your Monica AI configuration.
 def main():
     """Main entry point."""
     
-    # Ensure required directories exist
-    for directory in ['logs', 'input', 'output']:
-        Path(directory).mkdir(exist_ok=True)
+    global _DIRS_READY
+    
+    # Ensure required directories exist (once per process)
+    if not _DIRS_READY:
+        for directory in ('logs', 'input', 'output'):
+            Path(directory).mkdir(exist_ok=True)
+        _DIRS_READY = True
     
     # Check configuration file
     config_file = Path('src/workflow/workflow_config.yaml')
@@ -0,0 +1,8 @@
+"""Shared test setup: make the src/ packages importable the way the workflow does."""
+
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / 'src'
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
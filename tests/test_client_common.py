@@ -0,0 +1,84 @@
+"""Tests for the Monica API retry policy, retry budget and response decoding."""
+
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+
+from api.client_common import RetryBudget, RetryPolicy, decode_completion
+
+
+def test_budget_allows_retries_until_min_samples():
+    budget = RetryBudget(min_samples=5)
+    for _ in range(4):
+        budget.record_failure()
+    assert budget.should_allow_retry()
+
+
+def test_budget_trips_on_sustained_failures_and_recovers():
+    budget = RetryBudget(alpha=0.2, failure_threshold=0.5, min_samples=5)
+    for _ in range(5):
+        budget.record_failure()
+    assert not budget.should_allow_retry()
+    
+    for _ in range(5):
+        budget.record_success()
+    assert budget.should_allow_retry()
+
+
+def test_budget_tolerates_occasional_failures():
+    budget = RetryBudget()
+    for _ in range(10):
+        for _ in range(3):
+            budget.record_success()
+        budget.record_failure()
+    assert budget.should_allow_retry()
+
+
+@pytest.fixture
+def policy():
+    return RetryPolicy(logging.getLogger(__name__), budget=RetryBudget(), max_delay=60)
+
+
+@pytest.mark.parametrize('attempt, expected_cap', [(0, 5), (1, 10), (3, 40), (4, 60), (10, 60)])
+def test_backoff_uses_full_jitter_up_to_capped_exponential(policy, attempt, expected_cap):
+    policy._rng = MagicMock()
+    policy._rng.uniform.side_effect = lambda low, high: high
+    
+    assert policy.calculate_backoff_delay(attempt, 5) == expected_cap
+    policy._rng.uniform.assert_called_once_with(0, expected_cap)
+
+
+def test_backoff_stays_within_bounds(policy):
+    delays = [policy.calculate_backoff_delay(2, 5) for _ in range(200)]
+    assert all(0 <= delay <= 20 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_backoff_explicit_max_delay_overrides_policy(policy):
+    policy._rng = MagicMock()
+    policy._rng.uniform.side_effect = lambda low, high: high
+    assert policy.calculate_backoff_delay(5, 5, max_delay=7) == 7
+
+
+def test_next_delay_retries_until_last_attempt(policy):
+    assert policy.next_delay(0, 3, 1) is not None
+    assert policy.next_delay(1, 3, 1) is not None
+    assert policy.next_delay(2, 3, 1) is None
+    assert policy.budget.samples == 3
+
+
+def test_next_delay_gives_up_once_budget_is_exhausted(policy):
+    for _ in range(5):
+        policy.budget.record_failure()
+    assert policy.next_delay(0, 3, 1) is None
+
+
+def test_decode_completion_returns_first_message_content():
+    raw = b'{"id": "x", "choices": [{"message": {"role": "assistant", "content": "Hi"}}], "usage": {}}'
+    assert decode_completion(raw) == "Hi"
+
+
+@pytest.mark.parametrize('raw', [b'{"choices": []}', b'{"choices": [{}]}', b'{}'])
+def test_decode_completion_without_content_returns_none(raw):
+    assert decode_completion(raw) is None
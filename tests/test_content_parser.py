@@ -0,0 +1,112 @@
+"""Tests for ContentParser's on-disk LLM result cache and parsed output layout."""
+
+import json
+
+import pytest
+
+from scraper.content_parser import ContentParser, ParsedCompetitionInfo
+
+CONTENT = "Demo Challenge: applications open, prize of £10,000"
+
+PARSED = {
+    "competition_basic_info": {"name": "Demo Challenge", "application_status": "open"},
+    "target_participants": {"description": "Early-stage founders", "criteria": ["UK based"]},
+    "benefits_and_prizes": {"prize_fund": "£10,000"}
+}
+
+
+class FakeLLM:
+    """Counts completions; returns PARSED as JSON, or `response` when set."""
+    
+    def __init__(self, response=None):
+        self.calls = 0
+        self.response = response
+    
+    def complete(self, prompt):
+        self.calls += 1
+        return self.response if self.response is not None else json.dumps(PARSED)
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return tmp_path / 'parser_cache'
+
+
+def make_parser(llm, cache_dir):
+    return ContentParser(llm_client=llm, config={'cache_dir': str(cache_dir)})
+
+
+def test_llm_result_is_cached_across_parsers(cache_dir):
+    llm = FakeLLM()
+    first = make_parser(llm, cache_dir).parse_content(CONTENT)
+    second = make_parser(llm, cache_dir).parse_content(CONTENT)
+    
+    assert llm.calls == 1
+    assert first.name == second.name == "Demo Challenge"
+    assert second.parsing_method == 'llm'
+    assert [p.suffix for p in cache_dir.iterdir()] == ['.json']
+
+
+def test_changed_content_misses_cache(cache_dir):
+    llm = FakeLLM()
+    parser = make_parser(llm, cache_dir)
+    parser.parse_content(CONTENT)
+    parser.parse_content(CONTENT + " (updated)")
+    
+    assert llm.calls == 2
+
+
+def test_force_bypasses_cache(cache_dir):
+    llm = FakeLLM()
+    parser = make_parser(llm, cache_dir)
+    parser.parse_content(CONTENT)
+    parser.parse_content(CONTENT, force=True)
+    
+    assert llm.calls == 2
+
+
+def test_unparseable_llm_response_falls_back_and_is_not_cached(cache_dir):
+    llm = FakeLLM(response="Sorry, I can't help with that")
+    parser = make_parser(llm, cache_dir)
+    info = parser.parse_content(CONTENT)
+    
+    assert info.parsing_method == 'rules'
+    assert info.application_status == 'open'
+    assert not cache_dir.exists() or not any(cache_dir.iterdir())
+
+
+def test_corrupt_cache_entry_is_ignored(cache_dir):
+    llm = FakeLLM()
+    parser = make_parser(llm, cache_dir)
+    parser.parse_content(CONTENT)
+    (entry,) = cache_dir.iterdir()
+    entry.write_bytes(b'{"competition_basic_info": ')
+    
+    assert parser.parse_content(CONTENT).name == "Demo Challenge"
+    assert llm.calls == 2
+    assert json.loads(entry.read_bytes()) == PARSED
+
+
+def test_disabled_cache_always_calls_llm(cache_dir):
+    llm = FakeLLM()
+    parser = ContentParser(llm_client=llm, config={'cache_enabled': False, 'cache_dir': str(cache_dir)})
+    parser.parse_content(CONTENT)
+    parser.parse_content(CONTENT)
+    
+    assert llm.calls == 2
+    assert not cache_dir.exists()
+
+
+def test_saved_layout_maps_flat_fields_to_sections(tmp_path):
+    info = ParsedCompetitionInfo(name="Demo", target_description="Founders", eligibility_criteria=["UK"],
+                                 confidence_score=0.5, parsing_method='llm')
+    path = tmp_path / 'parsed.json'
+    ContentParser().save_parsed_info(info, str(path))
+    
+    saved = json.loads(path.read_text(encoding='utf-8'))
+    assert list(saved) == ["competition_basic_info", "target_participants", "competition_focus",
+                           "benefits_and_prizes", "evaluation_criteria", "metadata"]
+    assert saved["competition_basic_info"]["name"] == "Demo"
+    assert saved["target_participants"] == {"description": "Founders", "criteria": ["UK"]}
+    assert saved["metadata"]["confidence_score"] == 0.5
+    assert "parsing_method" not in saved["metadata"]
@@ -0,0 +1,175 @@
+"""Tests for the synchronous Monica API client, with the HTTP session mocked out."""
+
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from api.client_common import RetryBudget
+from api.monica_client import MonicaClient, StreamingError
+
+
+def make_response(status_code, body=b'', content_type='application/json', lines=None):
+    """Build a fake streamed requests.Response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = {'Content-Type': content_type}
+    response.text = body.decode('utf-8')
+    response.iter_content.return_value = [body]
+    response.iter_lines.return_value = lines or []
+    return response
+
+
+@pytest.fixture
+def client():
+    """MonicaClient with a private retry budget and a mocked session."""
+    client = MonicaClient('https://api.test/v1', 'key', 'model', budget=RetryBudget())
+    client.session = MagicMock()
+    return client
+
+
+def stream(client, **kwargs):
+    kwargs.setdefault('retry_delay', 0)
+    return ''.join(client.complete_stream('prompt', **kwargs))
+
+
+@pytest.mark.parametrize('status_code', [400, 415, 422])
+def test_complete_stream_rejected_request_raises_streaming_error(client, status_code):
+    client.session.post.return_value = make_response(status_code, b'{"error": "bad request"}')
+    
+    with pytest.raises(StreamingError):
+        stream(client)
+    assert client.session.post.call_count == 1
+
+
+@pytest.mark.parametrize('status_code', [401, 403, 404])
+def test_complete_stream_auth_and_not_found_are_plain_failures(client, status_code):
+    client.session.post.return_value = make_response(status_code, b'{"error": "denied"}')
+    
+    with pytest.raises(Exception) as excinfo:
+        stream(client)
+    assert not isinstance(excinfo.value, StreamingError)
+    assert client.session.post.call_count == 1
+
+
+def test_complete_stream_error_mentioning_stream_raises_streaming_error(client):
+    client.session.post.return_value = make_response(403, b'{"error": "Streaming is not enabled for this key"}')
+    
+    with pytest.raises(StreamingError):
+        stream(client)
+
+
+def test_complete_stream_retries_transient_status(client):
+    client.session.post.side_effect = [
+        make_response(503, b'unavailable'),
+        make_response(200, content_type='text/event-stream', lines=[
+            b'data: {"choices": [{"delta": {"content": "Hello"}}]}',
+            b'data: {"choices": [{"delta": {"content": " world"}}]}',
+            b'data: [DONE]'
+        ])
+    ]
+    
+    assert stream(client) == 'Hello world'
+    assert client.session.post.call_count == 2
+
+
+def test_complete_stream_gives_up_after_retry_attempts(client):
+    client.session.post.return_value = make_response(503, b'unavailable')
+    
+    with pytest.raises(Exception, match='after 2 attempts') as excinfo:
+        stream(client, retry_attempts=2)
+    assert not isinstance(excinfo.value, StreamingError)
+
+
+def test_read_capped_body_returns_body_within_limit(client):
+    response = make_response(200)
+    response.iter_content.return_value = [b'a' * 10, b'b' * 10]
+    client.max_response_bytes = 20
+    
+    assert client._read_capped_body(response) == b'a' * 10 + b'b' * 10
+
+
+def test_read_capped_body_stops_over_limit(client):
+    response = make_response(200)
+    response.iter_content.return_value = iter([b'a' * 10, b'b' * 11, b'c' * 10])
+    client.max_response_bytes = 20
+    
+    assert client._read_capped_body(response) is None
+    response.close.assert_called_once()
+
+
+def test_iter_stream_content_parses_data_lines(client):
+    response = make_response(200, content_type='text/event-stream', lines=[
+        b': keep-alive',
+        b'event: message',
+        b'data: {"choices": [{"delta": {"role": "assistant"}}]}',
+        b'data:{"choices": [{"delta": {"content": "Hel"}}]}',
+        b'',
+        b'data: {"choices": [{"delta": {"content": "lo"}}]}',
+        b'data: [DONE]',
+        b'data: {"choices": [{"delta": {"content": "ignored"}}]}'
+    ])
+    
+    assert list(client._iter_stream_content(response)) == ['Hel', 'lo']
+
+
+def test_iter_stream_content_enforces_size_cap(client):
+    client.max_response_bytes = 50
+    response = make_response(200, content_type='text/event-stream', lines=[
+        b'data: {"choices": [{"delta": {"content": "' + b'x' * 40 + b'"}}]}'
+    ])
+    
+    with pytest.raises(Exception, match='exceeded'):
+        list(client._iter_stream_content(response))
+
+
+def test_complete_stream_falls_back_to_buffered_body(client):
+    client.session.post.return_value = make_response(
+        200, b'{"choices": [{"message": {"content": "Whole answer"}}]}'
+    )
+    
+    assert list(client.complete_stream('prompt', retry_delay=0)) == ['Whole answer']
+
+
+def test_complete_stream_malformed_event_raises_streaming_error(client):
+    client.session.post.return_value = make_response(200, content_type='text/event-stream', lines=[
+        b'data: {not json'
+    ])
+    
+    with pytest.raises(StreamingError, match='Malformed'):
+        stream(client)
+
+
+def test_complete_stream_interrupted_after_first_chunk_is_not_retried(client):
+    response = make_response(200, content_type='text/event-stream')
+    
+    def lines():
+        yield b'data: {"choices": [{"delta": {"content": "partial"}}]}'
+        raise requests.exceptions.ConnectionError("connection reset")
+    
+    response.iter_lines.return_value = lines()
+    client.session.post.return_value = response
+    
+    chunks = []
+    with pytest.raises(StreamingError, match='interrupted'):
+        for chunk in client.complete_stream('prompt', retry_delay=0):
+            chunks.append(chunk)
+    assert chunks == ['partial']
+    assert client.session.post.call_count == 1
+
+
+def test_complete_stream_retries_connection_error_before_first_chunk(client):
+    client.session.post.side_effect = [
+        requests.exceptions.ConnectionError("refused"),
+        make_response(200, content_type='text/event-stream', lines=[
+            b'data: {"choices": [{"delta": {"content": "ok"}}]}'
+        ])
+    ]
+    
+    assert stream(client) == 'ok'
+    assert client.session.post.call_count == 2
+
+
+def test_complete_without_attempts_fails_cleanly(client):
+    with pytest.raises(Exception, match='after 0 attempts'):
+        client.complete('prompt', retry_attempts=0)
@@ -0,0 +1,74 @@
+"""Tests for CompetitionScraper.has_fresh_result."""
+
+import json
+import os
+import time
+
+import pytest
+
+from workflow.scrape_website import CompetitionScraper
+
+URL = 'https://example.com/competition'
+
+
+@pytest.fixture
+def make_scraper(tmp_path, monkeypatch):
+    """Build a CompetitionScraper for URL with the given result_cache_ttl."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'logs').mkdir()
+    
+    def make_scraper(ttl):
+        config_path = tmp_path / 'scraper_config.json'
+        config_path.write_text(json.dumps({'result_cache_ttl': ttl}), encoding='utf-8')
+        return CompetitionScraper('demo', URL, str(config_path))
+    return make_scraper
+
+
+@pytest.fixture
+def output_dir(tmp_path):
+    """Directory holding a successful scrape of URL, saved just now."""
+    output_dir = tmp_path / 'competition_info'
+    output_dir.mkdir()
+    (output_dir / 'scraped_content.txt').write_text('content', encoding='utf-8')
+    write_state(output_dir, success=True, url=URL)
+    return output_dir
+
+
+def write_state(output_dir, **metadata):
+    state = {'metadata': metadata, 'links': [], 'images': []}
+    (output_dir / 'workflow_state.json').write_text(json.dumps(state), encoding='utf-8')
+
+
+def test_recent_successful_result_is_fresh(make_scraper, output_dir):
+    assert make_scraper(600).has_fresh_result(output_dir)
+
+
+def test_result_older_than_ttl_is_stale(make_scraper, output_dir):
+    old = time.time() - 601
+    os.utime(output_dir / 'scraped_content.txt', (old, old))
+    
+    assert not make_scraper(600).has_fresh_result(output_dir)
+
+
+def test_zero_ttl_disables_reuse(make_scraper, output_dir):
+    assert not make_scraper(0).has_fresh_result(output_dir)
+
+
+def test_failed_result_is_not_reused(make_scraper, output_dir):
+    write_state(output_dir, success=False, url=URL)
+    
+    assert not make_scraper(600).has_fresh_result(output_dir)
+
+
+def test_result_for_another_url_is_not_reused(make_scraper, output_dir):
+    write_state(output_dir, success=True, url='https://example.com/other')
+    
+    assert not make_scraper(600).has_fresh_result(output_dir)
+
+
+def test_missing_or_corrupt_state_is_not_fresh(make_scraper, output_dir):
+    (output_dir / 'workflow_state.json').write_text('{"metadata": ', encoding='utf-8')
+    assert not make_scraper(600).has_fresh_result(output_dir)
+    
+    (output_dir / 'workflow_state.json').unlink()
+    assert not make_scraper(600).has_fresh_result(output_dir)
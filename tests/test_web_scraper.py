@@ -0,0 +1,136 @@
+"""Tests for WebScraper's capped reads, cache filter and pre-scrape probe, with HTTP mocked out."""
+
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from scraper.web_scraper import WebScraper, ScrapingResult, _read_capped, _PROBE_BYTES
+
+ARTICLE_HTML = (
+    b'<html><head><title>Demo Challenge</title></head><body><main><p>'
+    + b'The Demo Challenge startup competition offers a prize fund and mentorship. ' * 10
+    + b'</p></main></body></html>'
+)
+
+SHELL_HTML = b'<html><body><div id="root"></div><script src="/app.js"></script></body></html>'
+
+
+def make_response(status_code=200, chunks=(), headers=None, raw_tell=0):
+    """Build a fake streamed requests.Response usable as a context manager."""
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.iter_content.side_effect = lambda chunk_size: iter(chunks)
+    response.raw.tell.return_value = raw_tell
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(f"{status_code} error")
+    return response
+
+
+@pytest.fixture
+def scraper():
+    """WebScraper without the on-disk cache or delays, over a mocked session."""
+    scraper = WebScraper({'cache_enabled': False, 'request_delay': 0, 'max_bytes': 100_000})
+    scraper.session = MagicMock()
+    return scraper
+
+
+def test_read_capped_stops_one_byte_past_limit():
+    response = make_response(chunks=[b'a' * 6, b'b' * 6, b'c' * 6])
+    
+    assert _read_capped(response, 8) == b'a' * 6 + b'b' * 3
+
+
+def test_read_capped_returns_short_body_whole():
+    response = make_response(chunks=[b'abc', b'def'])
+    
+    assert _read_capped(response, 8) == b'abcdef'
+
+
+@pytest.mark.parametrize('headers, cacheable', [
+    ({'Content-Length': '1000'}, True),
+    ({'Content-Length': '100000'}, True),
+    ({'Content-Length': '100001'}, False),
+    ({'Content-Length': 'abc'}, False),
+    ({}, False)
+])
+def test_cache_filter_only_admits_bodies_within_max_bytes(scraper, headers, cacheable):
+    assert scraper._is_cacheable_response(make_response(headers=headers)) is cacheable
+
+
+def test_probe_small_page_returns_full_body(scraper):
+    scraper.session.get.return_value = make_response(200, [ARTICLE_HTML])
+    
+    assert scraper._probe_url('https://example.com') == (False, ARTICLE_HTML, None)
+
+
+def test_probe_complete_range_returns_full_body(scraper):
+    size = len(ARTICLE_HTML)
+    scraper.session.get.return_value = make_response(
+        206, [ARTICLE_HTML], headers={'Content-Range': f'bytes 0-{size - 1}/{size}'}, raw_tell=size
+    )
+    
+    assert scraper._probe_url('https://example.com') == (False, ARTICLE_HTML, None)
+
+
+def test_probe_partial_range_returns_no_body(scraper):
+    scraper.session.get.return_value = make_response(
+        206, [ARTICLE_HTML], headers={'Content-Range': f'bytes 0-{_PROBE_BYTES - 1}/500000'}, raw_tell=_PROBE_BYTES
+    )
+    
+    assert scraper._probe_url('https://example.com') == (False, None, None)
+
+
+def test_probe_detects_javascript_shell(scraper):
+    scraper.session.get.return_value = make_response(200, [SHELL_HTML])
+    
+    is_shell, full_body, failure = scraper._probe_url('https://example.com')
+    assert is_shell and full_body == SHELL_HTML and failure is None
+
+
+def test_probe_connection_error_is_final_static_failure(scraper):
+    scraper.session.get.side_effect = requests.exceptions.ConnectionError("refused")
+    
+    is_shell, full_body, failure = scraper._probe_url('https://example.com')
+    assert not is_shell and full_body is None
+    assert not failure.success and failure.scraping_method == 'static'
+
+
+def test_probe_http_error_is_inconclusive(scraper):
+    scraper.session.get.return_value = make_response(416)
+    
+    assert scraper._probe_url('https://example.com') == (False, None, None)
+
+
+def test_scrape_url_parses_probed_body_without_second_download(scraper):
+    scraper.session.get.return_value = make_response(200, [ARTICLE_HTML])
+    scraper.scrape_dynamic_content = MagicMock()
+    
+    result = scraper.scrape_url('https://example.com')
+    
+    assert result.success and result.title == 'Demo Challenge'
+    assert scraper.session.get.call_count == 1
+    scraper.scrape_dynamic_content.assert_not_called()
+
+
+def test_scrape_url_routes_javascript_shell_to_dynamic(scraper):
+    scraper.session.get.return_value = make_response(200, [SHELL_HTML])
+    dynamic = ScrapingResult(url='https://example.com', success=True, content='rendered', scraping_method='dynamic')
+    scraper.scrape_dynamic_content = MagicMock(return_value=dynamic)
+    
+    assert scraper.scrape_url('https://example.com') is dynamic
+    assert scraper.session.get.call_count == 1
+
+
+def test_scrape_url_does_not_refetch_after_probe_connection_error(scraper):
+    scraper.session.get.side_effect = requests.exceptions.ConnectionError("refused")
+    scraper.scrape_dynamic_content = MagicMock(return_value=ScrapingResult(
+        url='https://example.com', success=False, error_message='no browser', scraping_method='dynamic'
+    ))
+    
+    result = scraper.scrape_url('https://example.com')
+    
+    assert not result.success and 'refused' in result.error_message
+    assert scraper.session.get.call_count == 1
@@ -0,0 +1,210 @@
+"""Tests for the workflow steps' caching and skip logic, with the network mocked out."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+import yaml
+
+from api import monica_client
+from api.monica_client import StreamingError
+from scraper import content_parser, web_scraper
+from scraper.web_scraper import ScrapingResult
+from workflow.workflow_execution import WorkflowExecutor
+
+PARSED = {
+    "competition_basic_info": {"name": "Demo Challenge", "deadline": "1/2/2026"},
+    "benefits_and_prizes": {"prize_fund": "£10,000"}
+}
+
+
+class FakeLLM:
+    """Stands in for MonicaAIClient, counting calls and failing while `failing` is set."""
+    
+    def __init__(self):
+        self.calls = 0
+        self.failing = False
+    
+    def complete(self, prompt):
+        self.calls += 1
+        if self.failing:
+            raise Exception("API unavailable")
+        return json.dumps(PARSED)
+
+
+class FakeMonicaClient:
+    """Stands in for MonicaClient in application generation, raising the configured errors."""
+    
+    def __init__(self):
+        self.stream_calls = 0
+        self.complete_calls = 0
+        self.stream_error = None
+        self.complete_error = None
+    
+    def __call__(self, **kwargs):
+        return self
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+    
+    def complete_stream(self, prompt, **kwargs):
+        self.stream_calls += 1
+        if self.stream_error is not None:
+            raise self.stream_error
+        yield "# Application\n"
+        yield "Streamed answer"
+    
+    def complete(self, prompt, **kwargs):
+        self.complete_calls += 1
+        if self.complete_error is not None:
+            raise self.complete_error
+        return "# Application\nBuffered answer"
+
+
+@pytest.fixture
+def executor(tmp_path, monkeypatch):
+    """WorkflowExecutor working inside tmp_path, with the parser's own cache disabled."""
+    monkeypatch.chdir(tmp_path)
+    config = {
+        'paths': {'input_base': 'input', 'output_base': 'output', 'prompt_template': 'prompt.md'},
+        'reference_docs': {},
+        'scraper_settings': {},
+        'parser_settings': {'cache_enabled': False},
+        'llm_settings': {'api_key': 'key', 'base_url': 'https://api.test/v1', 'model': 'model'},
+        'debug': False
+    }
+    config_path = tmp_path / 'workflow_config.yaml'
+    config_path.write_text(yaml.safe_dump(config), encoding='utf-8')
+    (tmp_path / 'prompt.md').write_text("Application for {COMPETITION_NAME}\n{reference_data}", encoding='utf-8')
+    return WorkflowExecutor(str(config_path))
+
+
+@pytest.fixture
+def llm(monkeypatch):
+    llm = FakeLLM()
+    monkeypatch.setattr(content_parser, 'MonicaAIClient', lambda **kwargs: llm)
+    return llm
+
+
+@pytest.fixture
+def monica(monkeypatch):
+    monica = FakeMonicaClient()
+    monkeypatch.setattr(monica_client, 'MonicaClient', monica)
+    return monica
+
+
+@pytest.fixture
+def scrape(executor, monkeypatch):
+    """Run the scraping step against a fake scraper returning the given content."""
+    def scrape(content):
+        scraper = MagicMock()
+        scraper.__enter__.return_value = scraper
+        scraper.scrape_url.return_value = ScrapingResult(
+            url='https://example.com', success=True, content=content, scraping_method='static'
+        )
+        monkeypatch.setattr(web_scraper, 'WebScraper', lambda config: scraper)
+        assert executor.execute_scraping('demo', 'https://example.com')
+    return scrape
+
+
+def load_parsed_info(executor):
+    path = executor.competition_info_dir('demo') / 'parsed_competition_info.json'
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def test_parsing_skipped_when_content_unchanged(executor, llm, scrape):
+    scrape("Demo Challenge, apply now")
+    assert executor.execute_parsing('demo')
+    scrape("Demo Challenge, apply now")
+    assert executor.execute_parsing('demo')
+    
+    assert llm.calls == 1
+    assert load_parsed_info(executor)['competition_basic_info']['name'] == "Demo Challenge"
+
+
+def test_parsing_repeated_when_content_changes(executor, llm, scrape):
+    scrape("Demo Challenge, apply now")
+    assert executor.execute_parsing('demo')
+    scrape("Demo Challenge, applications closed")
+    assert executor.execute_parsing('demo')
+    
+    assert llm.calls == 2
+
+
+def test_failed_parse_is_retried_on_next_run(executor, llm, scrape):
+    scrape("Demo Challenge, apply now")
+    assert executor.execute_parsing('demo')
+    
+    # New content arrives while the LLM is down: the rule-based fallback is saved
+    new_content = "Demo Challenge, applications closed, prize of £5,000"
+    scrape(new_content)
+    llm.failing = True
+    assert executor.execute_parsing('demo')
+    assert llm.calls == 2
+    assert load_parsed_info(executor)['competition_basic_info']['name'] is None
+    
+    # Same content on the next run must not reuse the fallback result
+    llm.failing = False
+    scrape(new_content)
+    assert executor.execute_parsing('demo')
+    assert llm.calls == 3
+    assert load_parsed_info(executor)['competition_basic_info']['name'] == "Demo Challenge"
+    
+    # Now that the LLM parse succeeded, it is reused
+    assert executor.execute_parsing('demo')
+    assert llm.calls == 3
+
+
+def read_application(executor):
+    path = executor.competition_output_dir('demo') / 'demo_application.md'
+    return path.read_text(encoding='utf-8')
+
+
+def cached_outputs(tmp_path):
+    cache_dir = tmp_path / 'logs' / 'llm_cache'
+    return sorted(cache_dir.iterdir()) if cache_dir.exists() else []
+
+
+def test_application_reused_for_identical_prompt(executor, monica, tmp_path):
+    assert executor.execute_application_generation('demo')
+    assert executor.execute_application_generation('demo')
+    
+    assert monica.stream_calls == 1
+    assert read_application(executor) == "# Application\nStreamed answer"
+    assert [p.suffix for p in cached_outputs(tmp_path)] == ['.md']
+
+
+def test_changed_prompt_misses_output_cache(executor, monica, tmp_path):
+    assert executor.execute_application_generation('demo')
+    (tmp_path / 'prompt.md').write_text("Revised application for {COMPETITION_NAME}", encoding='utf-8')
+    assert executor.execute_application_generation('demo')
+    
+    assert monica.stream_calls == 2
+    assert len(cached_outputs(tmp_path)) == 2
+
+
+def test_streaming_error_falls_back_to_buffered_call(executor, monica, tmp_path):
+    monica.stream_error = StreamingError("stream flag unsupported")
+    
+    assert executor.execute_application_generation('demo')
+    assert monica.complete_calls == 1
+    assert read_application(executor) == "# Application\nBuffered answer"
+    assert len(cached_outputs(tmp_path)) == 1
+
+
+def test_api_failure_writes_notice_and_is_not_cached(executor, monica, tmp_path):
+    monica.stream_error = Exception("API call failed (status code: 401)")
+    
+    assert executor.execute_application_generation('demo')
+    assert monica.complete_calls == 0
+    assert read_application(executor).startswith("# Application Generation Failed")
+    assert cached_outputs(tmp_path) == []
+    
+    # The next run tries the API again instead of serving the failure notice
+    monica.stream_error = None
+    assert executor.execute_application_generation('demo')
+    assert monica.stream_calls == 2
+    assert read_application(executor) == "# Application\nStreamed answer"